@@ -0,0 +1,443 @@
+#!/usr/bin/python
+"""
+Benchmarks for outback-inverter. Each benchmark prints its results as JSON.
+
+    python outback_bench.py transport --host 10.1.1.3 --port 502
+    python outback_bench.py lookup
+    python outback_bench.py decode
+    python outback_bench.py decrypt
+    python outback_bench.py startup
+    python outback_bench.py suite --output bench-0.1.2.json
+
+The suite runs against a simulated AXS Port (outback_sim.py), so it needs no hardware.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import outback_decode
+import outback_sim
+from outback_defs import *
+from outback_pipeline import PipelinedClient
+from pyModbusTCP.client import ModbusClient
+
+
+def benchTransport(host, port, requests=200, count=60, depth=PIPELINE_DEPTH, address=ADDR_START):
+    """
+    Requests per second reading the same block with the pyModbusTCP client
+    (one request at a time) and with PipelinedClient.read_many().
+
+    :param host: IP Address of the AXS Port
+    :param port: Modbus TCP port
+    :param requests: Number of reads per transport
+    :param count: Registers per read
+    :param depth: Pipeline depth
+    :param address: First register of the block
+    """
+    results = {'requests': requests, 'count': count, 'depth': depth}
+    client = ModbusClient()
+    client.host(host)
+    client.port(port)
+    if not client.open():
+        raise IOError('Could not connect to %s:%s' % (host, port))
+    start = time.time()
+    failed = 0
+    for i in range(requests):
+        if client.read_holding_registers(address, count) is None:
+            failed += 1
+    elapsed = time.time() - start
+    client.close()
+    results['pymodbustcp'] = {'requests_per_sec': requests / elapsed, 'failed': failed}
+    pipelined = PipelinedClient(host, port, depth=depth)
+    start = time.time()
+    registers = pipelined.read_many([(address, count)] * requests)
+    elapsed = time.time() - start
+    pipelined.close()
+    results['pipelined'] = {'requests_per_sec': requests / elapsed,
+                            'failed': registers.count(None),
+                            'fell_back': not pipelined.pipelining}
+    results['speedup'] = results['pipelined']['requests_per_sec'] / results['pymodbustcp']['requests_per_sec']
+    return results
+
+
+def linearLookup(regname):
+    """
+    Register lookup the way it was done before REGISTER_INDEX: register name prefix to model,
+    then a scan of the model's fields. Kept as the baseline for benchLookup().
+
+    :param regname: The register name
+    """
+    regprefix = regname.split('_')[0]
+    models = {'OutBack': 64110, 'CC': 64111, 'CCconfig': 64112, 'GSconfig': 64116, 'FX': 64113,
+              'FXconfig': 64114, 'FN': 64118, 'FNconfig': 64119, 'OB': 64120, 'C': 1, 'I': 101}
+    if regprefix == 'GS':
+        model = 64115 if regname.split('_')[1] == 'Split' else 64117
+    else:
+        model = models.get(regprefix)
+    for field in SUNSPEC_DEVICE_MAP.get(model, []):
+        if field[7] == regname:
+            return model, field
+    return None
+
+
+def benchLookup(iterations=20):
+    """
+    Cost per register lookup (name to model and field) of the linear scan and of REGISTER_INDEX,
+    over every register name the scan can resolve.
+
+    :param iterations: Number of passes over all the register names
+    """
+    names = [name for name in REGISTER_INDEX if linearLookup(name) is not None]
+    results = {'registers': len(names), 'iterations': iterations}
+    for label, lookup in (('linear', linearLookup), ('index', REGISTER_INDEX.get)):
+        start = time.time()
+        for i in range(iterations):
+            for name in names:
+                lookup(name)
+        elapsed = time.time() - start
+        results[label] = {'ns_per_lookup': elapsed * 1e9 / (iterations * len(names))}
+    results['speedup'] = results['linear']['ns_per_lookup'] / results['index']['ns_per_lookup']
+    return results
+
+
+def benchDecode(iterations=200, models=(SUNSPEC_OUTBACK_STATISTICS_DID, SUNSPEC_OUTBACK_FNDC_DID), key=4660):
+    """
+    Whole block decode time, pure Python vs NumPy, on synthetic random blocks with and
+    without encryption. The NumPy numbers are left out when NumPy isn't installed.
+
+    :param iterations: Number of decodes of each block
+    :param models: SunSpec model DIDs to decode
+    :param key: Encryption key for the encrypted runs (decrypted through DECRYPT_TABLE)
+    """
+    results = {'iterations': iterations, 'numpy': outback_decode.numpy is not None, 'models': {}}
+    rand = random.Random(1)
+    table = DECRYPT_TABLE(key)
+    for did in models:
+        decoder = outback_decode.getDecoder(did)
+        block = [rand.randint(0, 0xFFFF) for i in range(decoder.length)]
+        model = results['models'][str(did)] = {'fields': len(decoder.fields), 'registers': decoder.length}
+        for label, blockTable in (('plain', None), ('encrypted', table)):
+            paths = [('python', decoder.decodeList)]
+            if outback_decode.numpy is not None:
+                paths.append(('numpy', decoder.decodeArray))
+            timing = model[label] = {}
+            for path, decode in paths:
+                start = time.time()
+                for i in range(iterations):
+                    decode(block, blockTable)
+                timing[path + '_us_per_block'] = (time.time() - start) * 1e6 / iterations
+            if 'numpy_us_per_block' in timing:
+                timing['speedup'] = timing['python_us_per_block'] / timing['numpy_us_per_block']
+    return results
+
+
+def benchDecrypt(words=100000, key=4660):
+    """
+    Decrypted words per second: DECRYPT() per word, the 64K DECRYPT_TABLE per word and, when NumPy
+    is installed, one table lookup over a whole array. Also times building both tables.
+
+    :param words: Number of random encrypted words to decrypt
+    :param key: Encryption key
+    """
+    rand = random.Random(1)
+    block = [rand.randint(0, 0xFFFF) for i in range(words)]
+    start = time.time()
+    table = DECRYPT_TABLE(key)
+    ENCRYPT_TABLE(key)
+    results = {'words': words, 'table_build_ms': (time.time() - start) * 1000}
+    paths = [('decrypt', lambda: [DECRYPT(key, r) for r in block]),
+             ('table', lambda: [table[r] for r in block])]
+    numpy = outback_decode.numpy
+    if numpy is not None:
+        array = numpy.asarray(block, dtype=numpy.uint16)
+        lookup = numpy.frombuffer(table, dtype=numpy.uint16)
+        paths.append(('table_numpy', lambda: lookup[array]))
+    expected = None
+    for label, decrypt in paths:
+        start = time.time()
+        decrypted = decrypt()
+        elapsed = time.time() - start
+        decrypted = [int(r) for r in decrypted]
+        if expected is None:
+            expected = decrypted
+        results[label] = {'mwords_per_sec': words / elapsed / 1e6, 'matches': decrypted == expected}
+    results['speedup'] = results['table']['mwords_per_sec'] / results['decrypt']['mwords_per_sec']
+    return results
+
+
+# Run in a fresh interpreter by benchStartup(): imports outback_defs, loads the models given and
+# prints the time it took, or the memory it allocated when traced, as JSON.
+STARTUP_SCRIPT = '''
+import json, time
+models, traced = %r, %r
+tracemalloc = None
+if traced:
+    try:
+        import tracemalloc
+        tracemalloc.start()
+    except ImportError:
+        pass
+start = time.time()
+import outback_defs
+imported = time.time() - start
+for did in (list(outback_defs.SUNSPEC_DEVICE_MAP) if models is None else models):
+    for field in outback_defs.SUNSPEC_DEVICE_MAP[did]:
+        outback_defs.REGISTER_INDEX.get(field[7])
+print(json.dumps({'import': imported, 'total': time.time() - start,
+                  'memory': tracemalloc.get_traced_memory()[0] if tracemalloc else None,
+                  'models': len(outback_defs.SUNSPEC_DEVICE_MAP.loaded())}))
+'''
+
+# Models an FX site with a FLEXnet-DC and a SunSpec inverter model uses
+FX_SITE_MODELS = [SUNSPEC_COMMON_MODEL_BLOCK_DID, SUNSPEC_INVERTER_SINGLE_DID, SUNSPEC_OUTBACK_DID,
+                  SUNSPEC_OUTBACK_FX_DID, SUNSPEC_OUTBACK_FX_CONFIG_DID, SUNSPEC_OUTBACK_FNDC_DID,
+                  SUNSPEC_OUTBACK_FNDC_CONFIG_DID, SUNSPEC_OUTBACK_SYS_CONTROL_DID]
+
+
+def benchStartup(runs=10):
+    """
+    Startup cost of the register definitions, each run in a fresh interpreter: importing
+    outback_defs alone, then loading the models of an FX site, then loading every model (what
+    every startup paid before the models were loaded lazily). Reports the median time and, from
+    one more traced run, the memory allocated (Python 3 only).
+
+    :param runs: Number of interpreters started for each case
+    """
+    cases = (('import', []), ('fx_site', FX_SITE_MODELS), ('all_models', None))
+    results = {'runs': runs}
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for label, models in cases:
+        samples = []
+        for traced in [False] * runs + [True]:
+            output = subprocess.check_output([sys.executable, '-c', STARTUP_SCRIPT % (models, traced)], cwd=directory)
+            samples.append(json.loads(output.decode('utf-8')))
+        memory = samples.pop()['memory']
+        results[label] = {'import_ms': summarize([s['import'] * 1000 for s in samples])['median'],
+                          'total_ms': summarize([s['total'] * 1000 for s in samples])['median'],
+                          'memory_kb': memory / 1024.0 if memory is not None else None,
+                          'models_loaded': samples[-1]['models']}
+    return results
+
+
+def startSimulator(inverters=2, kind='FX', key=None, latency=0.0):
+    """
+    Start a simulated AXS Port (with a FLEXnet-DC and a SunSpec inverter model) on a free local port.
+    Returns the SimulatorServer, its SimulatedGateway and the (host, port) it listens on.
+
+    :param inverters: Number of inverters in the stack
+    :param kind: 'FX' or 'GS'
+    :param key: Encryption key, None for an unencrypted AXS Port
+    :param latency: Seconds of delay the simulator adds to every request
+    """
+    gateway = outback_sim.SimulatedGateway(inverters, kind, fndc=True, key=key)
+    server = outback_sim.SimulatorServer(gateway, latency=latency, jitter=True)
+    return server, gateway, server.start()
+
+
+def startNodeServer(address):
+    """
+    Set up an OutbackNodeServer against one AXS Port without the discovery cache, so every setup
+    walks the SunSpec models, and without the on-disk history. Returns the node server.
+
+    :param address: (host, port) of the AXS Port
+    """
+    # Polyglot is only needed by the node server benchmarks
+    import outback_types
+    import outback_inverter
+    from polyglot.nodeserver_api import PolyglotConnector
+    outback_types.DISCOVERY_CACHE = None
+    outback_inverter.HISTORY_DIR = None
+    nodeserver = outback_inverter.OutbackNodeServer(PolyglotConnector(), 5, 30)
+    nodeserver.gateways = [address]
+    nodeserver.setup()
+    return nodeserver
+
+
+def stopNodeServer(nodeserver, server):
+    """
+    Close the node server's sessions and shut down the simulator.
+
+    :param nodeserver: The OutbackNodeServer from startNodeServer()
+    :param server: The SimulatorServer from startSimulator()
+    """
+    for controller in nodeserver.controllers:
+        controller.session.close()
+    server.shutdown()
+    server.server_close()
+
+
+def summarize(samples):
+    """
+    Min, median, mean and max of a list of timings.
+
+    :param samples: List of numbers
+    """
+    ordered = sorted(samples)
+    return {'min': ordered[0], 'median': ordered[len(ordered) // 2],
+            'mean': sum(ordered) / float(len(ordered)), 'max': ordered[-1]}
+
+
+def benchPoll(inverters=4, kind='FX', key=None, latency=0.002, cycles=20):
+    """
+    Setup and OutbackNodeServer.long_poll() cycle times against the simulator, with the
+    Modbus transactions (reads and writes seen by the simulator) of each.
+
+    :param inverters: Number of inverters in the stack
+    :param kind: 'FX' or 'GS'
+    :param key: Encryption key, None for an unencrypted AXS Port
+    :param latency: Seconds of delay the simulator adds to every request
+    :param cycles: Number of long polls
+    """
+    server, gateway, address = startSimulator(inverters, kind, key, latency)
+    start = time.time()
+    nodeserver = startNodeServer(address)
+    results = {'inverters': inverters, 'kind': kind, 'encrypted': key is not None, 'latency': latency,
+               'cycles': cycles, 'nodes': len(nodeserver.all_nodes()),
+               'setup': {'seconds': time.time() - start, 'transactions': gateway.reads + gateway.writes}}
+    times, transactions, sent, suppressed = [], [], 0, 0
+    try:
+        for i in range(cycles):
+            before = gateway.reads + gateway.writes
+            start = time.time()
+            report = nodeserver.long_poll()
+            times.append(time.time() - start)
+            transactions.append(gateway.reads + gateway.writes - before)
+            sent += sum(report['sent'].values())
+            suppressed += sum(report['suppressed'].values())
+    finally:
+        stopNodeServer(nodeserver, server)
+    results['long_poll'] = {'seconds': summarize(times), 'transactions': summarize(transactions),
+                            'transactions_total': sum(transactions), 'updates_sent': sent,
+                            'updates_suppressed': suppressed}
+    return results
+
+
+def benchDiscovery(sizes=(1, 2, 4, 8), key=None, latency=0.002):
+    """
+    OutbackNode.getDevices() time and transactions as the stack grows. Each size gets its own
+    simulator and node server, the timed walk is a rescan after setup.
+
+    :param sizes: Numbers of inverters in the stack
+    :param key: Encryption key, None for an unencrypted AXS Port
+    :param latency: Seconds of delay the simulator adds to every request
+    """
+    results = {'encrypted': key is not None, 'latency': latency, 'stacks': {}}
+    for size in sizes:
+        server, gateway, address = startSimulator(size, 'FX', key, latency)
+        nodeserver = startNodeServer(address)
+        try:
+            controller = nodeserver.controller
+            controller.session.setDevices([])
+            before = gateway.reads
+            start = time.time()
+            controller.getDevices()
+            results['stacks'][str(size)] = {'seconds': time.time() - start, 'transactions': gateway.reads - before,
+                                            'devices': len(controller.session.devices)}
+        finally:
+            stopNodeServer(nodeserver, server)
+    return results
+
+
+def benchCheckRegister(iterations=2000, key=4660):
+    """
+    checkRegister() decodes per second for each register type in SUNSPEC_DEVICE_MAP, plain and
+    encrypted, over every field of that type with random register values.
+
+    :param iterations: Number of decodes per register type
+    :param key: Encryption key for the encrypted runs
+    """
+    from outback_types import checkRegister
+    rand = random.Random(1)
+    table = DECRYPT_TABLE(key)
+    types = {}
+    for did, fields in SUNSPEC_DEVICE_MAP.items():
+        for field in fields:
+            if REGISTER_INDEX.get(field[7], (None,))[0] == did:
+                types.setdefault(field[2], []).append(field)
+    results = {'iterations': iterations, 'types': {}}
+    for regtype, fields in sorted(types.items()):
+        samples = [(field, [rand.randint(0, 0xFFFF) for i in range(field[1])]) for field in fields]
+        samples = (samples * (iterations // len(samples) + 1))[:iterations]
+        timing = results['types'][regtype] = {'fields': len(fields)}
+        for label, decryptTable in (('plain', None), ('encrypted', table)):
+            start = time.time()
+            for field, register in samples:
+                checkRegister(register, field[2], field[3], field[7], decryptTable)
+            timing[label + '_per_sec'] = iterations / (time.time() - start)
+    return results
+
+
+def benchSuite(latency=0.002, cycles=20, sizes=(1, 2, 4, 8), key=4660):
+    """
+    Every offline benchmark: long poll cycles and discovery against the simulator, plain and
+    encrypted, plus the lookup, decode, decrypt and checkRegister() micro benchmarks.
+
+    :param latency: Seconds of delay the simulator adds to every request
+    :param cycles: Number of long polls per run
+    :param sizes: Stack sizes for the discovery benchmark
+    :param key: Encryption key for the encrypted runs
+    """
+    from outback_inverter import VERSION
+    results = {'version': VERSION, 'python': platform.python_version(), 'numpy': outback_decode.numpy is not None,
+               'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'latency': latency}
+    for label, runKey in (('plain', None), ('encrypted', key)):
+        results['poll_' + label] = benchPoll(max(sizes), 'FX', runKey, latency, cycles)
+        results['poll_gs_' + label] = benchPoll(max(sizes), 'GS', runKey, latency, cycles)
+        results['discovery_' + label] = benchDiscovery(sizes, runKey, latency)
+    results['check_register'] = benchCheckRegister(key=key)
+    results['lookup'] = benchLookup()
+    results['decode'] = benchDecode(key=key)
+    results['decrypt'] = benchDecrypt(key=key)
+    results['startup'] = benchStartup()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='outback-inverter benchmarks')
+    sub = parser.add_subparsers(dest='bench')
+    transport = sub.add_parser('transport', help='pyModbusTCP vs pipelined requests/sec')
+    transport.add_argument('--host', default=DEVICEIP)
+    transport.add_argument('--port', type=int, default=int(DEVICEPORT))
+    transport.add_argument('--requests', type=int, default=200)
+    transport.add_argument('--count', type=int, default=60)
+    transport.add_argument('--depth', type=int, default=PIPELINE_DEPTH)
+    lookup = sub.add_parser('lookup', help='Register lookup cost, linear scan vs REGISTER_INDEX')
+    lookup.add_argument('--iterations', type=int, default=20)
+    decode = sub.add_parser('decode', help='Whole block decode, pure Python vs NumPy')
+    decode.add_argument('--iterations', type=int, default=200)
+    decrypt = sub.add_parser('decrypt', help='Decrypted words/sec, DECRYPT() vs lookup tables')
+    decrypt.add_argument('--words', type=int, default=100000)
+    startup = sub.add_parser('startup', help='Import time and memory of the register definitions')
+    startup.add_argument('--runs', type=int, default=10)
+    suite = sub.add_parser('suite', help='Poll cycles, discovery and decoding against the simulator')
+    suite.add_argument('--latency', type=float, default=0.002, help='Simulated request latency in seconds')
+    suite.add_argument('--cycles', type=int, default=20)
+    suite.add_argument('--sizes', type=int, nargs='+', default=[1, 2, 4, 8], help='Stack sizes for discovery')
+    suite.add_argument('--output', help='Also save the results to this JSON file')
+    args = parser.parse_args()
+    if args.bench == 'transport':
+        results = benchTransport(args.host, args.port, args.requests, args.count, args.depth)
+    elif args.bench == 'lookup':
+        results = benchLookup(args.iterations)
+    elif args.bench == 'decode':
+        results = benchDecode(args.iterations)
+    elif args.bench == 'decrypt':
+        results = benchDecrypt(args.words)
+    elif args.bench == 'startup':
+        results = benchStartup(args.runs)
+    elif args.bench == 'suite':
+        results = benchSuite(args.latency, args.cycles, args.sizes)
+    else:
+        parser.error('Pick a benchmark')
+    if getattr(args, 'output', None):
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1, sort_keys=True)
+    print(json.dumps(results, indent=1, sort_keys=True))
+
+if __name__ == '__main__':
+    main()
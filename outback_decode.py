@@ -0,0 +1,286 @@
+"""
+Compiled decoders that turn raw SunSpec register blocks into native values.
+"""
+
+import struct
+from outback_defs import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if str is bytes:
+    def toText(data): return data
+else:
+    def toText(data): return data.decode('latin-1')
+
+
+class NotImplementedValue(str):
+    """
+    Type of the NOT_IMPLEMENTED sentinel. It still compares equal to the 'Not Implemented'
+    string the nodes have always checked for, but can be told apart from real values.
+    """
+    pass
+
+NOT_IMPLEMENTED = NotImplementedValue('Not Implemented')
+
+# Raw values the AXS Port uses for fields it doesn't implement, by register type
+INT16_SENTINELS = frozenset([0xFFFF, 0x8000])
+INT32_SENTINELS = frozenset([0xFFFFFFFF, 0x00000000])
+HEX4_SENTINELS = frozenset([0xFFFF])
+ENUM_MAPS = {'I_Status': STATUS_MAP}
+
+# The SunSpec inverter models, whose values are scaled by their *_SF registers. The split and three
+# phase models share the layout of the single phase one in SUNSPEC_DEVICE_MAP.
+SCALED_MODELS = frozenset([SUNSPEC_INVERTER_SINGLE_DID, SUNSPEC_INVERTER_SPLIT_DID, SUNSPEC_INVERTER_3PHASE_DID])
+SCALE_FACTORS = frozenset(name for name, did in REGISTER_INDEX.names.items()
+                          if did == SUNSPEC_INVERTER_SINGLE_DID and name.endswith('_SF'))
+SCALE_FACTOR_UNSET = 0x8000
+
+
+def modelLayout(did):
+    """
+    The SUNSPEC_DEVICE_MAP model that describes a model DID (the single phase inverter model for
+    the split and three phase ones).
+
+    :param did: The SunSpec model DID
+    """
+    if did in (SUNSPEC_INVERTER_SPLIT_DID, SUNSPEC_INVERTER_3PHASE_DID): return SUNSPEC_INVERTER_SINGLE_DID
+    return did
+
+
+def compileField(field):
+    """
+    Compile one SUNSPEC_DEVICE_MAP field into a function that takes the field's (decrypted)
+    registers and returns a native int, float or str, or NOT_IMPLEMENTED.
+
+    :param field: The field from SUNSPEC_DEVICE_MAP
+    """
+    size, ftype, valType, name = field[1], field[2], field[3], field[7]
+    if name in SCALE_FACTORS:
+        # sunssf: signed, 0x8000 when not implemented
+        def decode(words):
+            if words[0] == SCALE_FACTOR_UNSET: return NOT_IMPLEMENTED
+            return words[0] - 0x10000 if words[0] & 0x8000 else words[0]
+    elif ftype == 'string':
+        fmt = struct.Struct('>%iH' % size)
+        def decode(words):
+            return toText(fmt.pack(*words))
+    elif ftype == 'ipaddress':
+        fmt = struct.Struct('>%iH' % size)
+        def decode(words):
+            return '.'.join(str(b) for b in bytearray(fmt.pack(*words)))
+    elif ftype in ('int32', 'hex8'):
+        def decode(words):
+            value = words[0] | words[1] << 16
+            return NOT_IMPLEMENTED if value in INT32_SENTINELS else value
+    elif ftype in ('float', 'float2'):
+        def decode(words):
+            return words[0] / 10.0
+    elif ftype == 'hex4':
+        def decode(words):
+            return NOT_IMPLEMENTED if words[0] in HEX4_SENTINELS else words[0]
+    elif ftype == 'uhex4':
+        # Scale factors and offsets, signed
+        def decode(words):
+            return words[0] - 0x10000 if words[0] & 0x8000 else words[0]
+    elif valType == 'ENUMERATED_U' and name in ENUM_MAPS:
+        labels = ENUM_MAPS[name]
+        def decode(words):
+            if words[0] in INT16_SENTINELS: return NOT_IMPLEMENTED
+            return labels[words[0]] if words[0] < len(labels) else words[0]
+    else:
+        def decode(words):
+            return NOT_IMPLEMENTED if words[0] in INT16_SENTINELS else words[0]
+    return decode
+
+
+def compileScaled(field):
+    """
+    Compile a SunSpec inverter field that has a scale factor into a function that takes the field's
+    (decrypted) registers and the scale factor and returns the scaled value as a float, whatever the
+    scale factor. The raw value is taken as SunSpec defines it (int16 signed, acc32 unsigned)
+    whatever type the defs give the field.
+
+    :param field: The field from SUNSPEC_DEVICE_MAP
+    """
+    if field[1] == 2:
+        def raw(words):
+            value = words[0] | words[1] << 16
+            return NOT_IMPLEMENTED if value in INT32_SENTINELS else value
+    else:
+        def raw(words):
+            if words[0] == 0x8000: return NOT_IMPLEMENTED
+            return words[0] - 0x10000 if words[0] & 0x8000 else words[0]
+    def decode(words, sf):
+        value = raw(words)
+        if value is NOT_IMPLEMENTED: return value
+        if sf < 0: return round(value * 10.0 ** sf, -sf)
+        return float(value * 10 ** sf)
+    return decode
+
+def vectorKind(field):
+    """
+    How the NumPy path extracts a field: 'int16', 'float', 'int32', 'uhex4' or 'hex4', None for
+    fields only the per-field decoder handles (strings, IP addresses, enumerations, scale factors).
+
+    :param field: The field from SUNSPEC_DEVICE_MAP
+    """
+    ftype = field[2]
+    if field[7] in SCALE_FACTORS: return None
+    if ftype in ('float', 'float2'): return 'float'
+    if ftype in ('int32', 'hex8'): return 'int32'
+    if ftype in ('uhex4', 'hex4'): return ftype
+    if ftype == 'int16' and not (field[3] == 'ENUMERATED_U' and field[7] in ENUM_MAPS): return 'int16'
+    return None
+
+def encodeValue(field, value):
+    """
+    The raw register value of a native value, the reverse of compileField() for the writable
+    (numeric) field types.
+
+    :param field: The field from SUNSPEC_DEVICE_MAP
+    :param value: The value in the units the decoder returns (e.g. volts for 'float' fields)
+    """
+    if field[2] in ('float', 'float2'):
+        return int(round(float(value) * 10))
+    return int(value)
+
+
+class ModelDecoder(object):
+    """
+    A SunSpec model compiled once into a table of field name to (offset, size, decoder).
+    Every field is decrypted (when a decrypt table is given) before it is decoded. When NumPy is
+    available, whole blocks are decrypted and the numeric fields extracted as arrays. Fields of the
+    SunSpec inverter models that have a scale factor also get a scaled decoder (`scales`), used
+    by decode() when the device's scale factors are known.
+
+    :param did: The SunSpec model DID in SUNSPEC_DEVICE_MAP
+    """
+    def __init__(self, did):
+        self.did = did
+        self.fields = {}
+        self.scales = {}
+        self.length = 0
+        groups = {}
+        self.others = []
+        for field in SUNSPEC_DEVICE_MAP[modelLayout(did)]:
+            decode = compileField(field)
+            self.fields[field[7]] = (field[0], field[1], decode)
+            if did in SCALED_MODELS and field[4] in SCALE_FACTORS:
+                self.scales[field[7]] = (field[4], compileScaled(field))
+            self.length = max(self.length, field[0] - 1 + field[1])
+            kind = vectorKind(field)
+            if kind is None:
+                self.others.append((field[7], field[0], field[1], decode))
+            else:
+                groups.setdefault(kind, []).append((field[7], field[0] - 1))
+        self.groups = {}
+        if numpy is not None:
+            for kind, entries in groups.items():
+                self.groups[kind] = ([name for name, index in entries],
+                                     numpy.array([index for name, index in entries], dtype=numpy.intp))
+
+    def decode(self, name, registers, table=None, scaleFactors=None):
+        """
+        Decode one field from its registers.
+
+        :param name: The register name
+        :param registers: The raw registers of the field
+        :param table: The session's decrypt table, None if the AXS Port isn't encrypted
+        :param scaleFactors: The device's cached scale factors {name: value or None}, None to not scale
+        """
+        if registers is None: return None
+        if table is not None: registers = [table[r] for r in registers]
+        if scaleFactors and name in self.scales:
+            sfname, scaled = self.scales[name]
+            sf = scaleFactors.get(sfname)
+            if sf is not None: return scaled(registers, sf)
+        return self.fields[name][2](registers)
+
+    def decodeBlock(self, registers, table=None):
+        """
+        Decode every field of the model from the registers of the whole block (starting at
+        field offset 1). Fields past the end of registers are left out.
+
+        :param registers: The raw registers of the model block
+        :param table: The session's decrypt table, None if the AXS Port isn't encrypted
+        """
+        if numpy is not None and len(registers) >= self.length:
+            return self.decodeArray(registers, table)
+        return self.decodeList(registers, table)
+
+    def decodeList(self, registers, table=None):
+        """
+        decodeBlock() in pure Python, one field at a time.
+
+        :param registers: The raw registers of the model block
+        :param table: The session's decrypt table, None if the AXS Port isn't encrypted
+        """
+        if table is not None: registers = [table[r] for r in registers]
+        values = {}
+        for name, (offset, size, decode) in self.fields.items():
+            if offset - 1 + size <= len(registers):
+                values[name] = decode(registers[offset - 1:offset - 1 + size])
+        return values
+
+    def decodeArray(self, registers, table=None):
+        """
+        decodeBlock() with NumPy: the block is decrypted with one table lookup and each group of
+        numeric fields is pulled out with a single index array. Strings, IP addresses and
+        enumerations go through their per-field decoders.
+
+        :param registers: The raw registers of the whole model block (list or numpy.uint16 array)
+        :param table: The session's decrypt table, None if the AXS Port isn't encrypted
+        """
+        block = numpy.asarray(registers, dtype=numpy.uint16)
+        if table is not None: block = numpy.frombuffer(table, dtype=numpy.uint16)[block]
+        values = {}
+        for kind, (names, index) in self.groups.items():
+            words = block[index]
+            if kind == 'float':
+                values.update(zip(names, (words / 10.0).tolist()))
+                continue
+            if kind == 'int32':
+                words = words.astype(numpy.uint32) | (block[index + 1].astype(numpy.uint32) << numpy.uint32(16))
+                missing = (words == 0xFFFFFFFF) | (words == 0)
+            elif kind == 'uhex4':
+                words = words.view(numpy.int16)
+                missing = numpy.zeros(len(names), dtype=bool)
+            elif kind == 'hex4':
+                missing = words == 0xFFFF
+            else:
+                missing = (words == 0xFFFF) | (words == 0x8000)
+            for name, value, absent in zip(names, words.tolist(), missing.tolist()):
+                values[name] = NOT_IMPLEMENTED if absent else value
+        if self.others:
+            plain = block.tolist()
+            for name, offset, size, decode in self.others:
+                values[name] = decode(plain[offset - 1:offset - 1 + size])
+        return values
+
+DECODERS = {}
+
+def getDecoder(did):
+    """
+    Gets the compiled decoder of a model, compiling it on first use. The split and three phase
+    inverter models use the layout of the single phase one.
+
+    :param did: The SunSpec model DID
+    """
+    decoder = DECODERS.get(did)
+    if decoder is None:
+        decoder = DECODERS[did] = ModelDecoder(did)
+    return decoder
+
+def decodeRegister(name, registers, table=None, scaleFactors=None):
+    """
+    Decode one register field by name. Returns None for a failed read.
+
+    :param name: The register name
+    :param registers: The raw registers of the field
+    :param table: The session's decrypt table, None if the AXS Port isn't encrypted
+    :param scaleFactors: The device's cached scale factors, None to not scale
+    """
+    return getDecoder(REGISTER_INDEX[name][0]).decode(name, registers, table, scaleFactors)
@@ -0,0 +1,96 @@
+"""
+Single-flight coalescing of concurrent node refreshes and register reads.
+"""
+
+import threading
+
+
+class Flight(object):
+    """
+    One call in progress, and its result once it is done.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+    def wait(self):
+        """
+        Wait for the call to finish and return its result (or raise its exception).
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+class SingleFlight(object):
+    """
+    Runs at most one call per key at a time. Callers arriving while a call with the same key is in
+    progress wait for it and get its result instead of running it again, so a QUERY that overlaps the
+    long poll doesn't read the same registers twice. Results aren't kept once the call is done.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.flights = {}
+        self.runs = 0
+        self.shared = 0
+
+    def claim(self, key):
+        """
+        Join the call in progress for a key, or start one. Returns (flight, leader): the leader must
+        run the call and finish() the flight, everyone else waits on it.
+
+        :param key: The key of the call
+        """
+        with self.lock:
+            flight = self.flights.get(key)
+            if flight is not None:
+                self.shared += 1
+                return flight, False
+            flight = self.flights[key] = Flight()
+            self.runs += 1
+            return flight, True
+
+    def finish(self, key, flight, result=None, error=None):
+        """
+        Hand the result of a claimed call to the callers waiting on it.
+
+        :param key: The key of the call
+        :param flight: The Flight returned by claim()
+        :param result: The result of the call
+        :param error: The exception the call raised, None if it didn't
+        """
+        with self.lock:
+            if self.flights.get(key) is flight:
+                del self.flights[key]
+        flight.result = result
+        flight.error = error
+        flight.done.set()
+
+    def do(self, key, function, *args):
+        """
+        Call function(*args), or wait for and return the result of the call already in progress
+        for the key.
+
+        :param key: The key of the call
+        :param function: The function to call
+        :param args: Arguments for the function
+        """
+        flight, leader = self.claim(key)
+        if not leader:
+            return flight.wait()
+        try:
+            result = function(*args)
+        except Exception as e:
+            self.finish(key, flight, error=e)
+            raise
+        self.finish(key, flight, result)
+        return result
+
+    def stats(self):
+        """
+        Calls run, calls that shared the result of one in progress, and calls in progress.
+        """
+        with self.lock:
+            return {'runs': self.runs, 'shared': self.shared, 'pending': len(self.flights)}
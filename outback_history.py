@@ -0,0 +1,375 @@
+"""
+History of the driver values polled from the AXS Port, in memory and on disk.
+"""
+
+import bisect
+import mmap
+import os
+import re
+import shutil
+import struct
+import threading
+import time
+from array import array
+from outback_defs import *
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Column files are in the byte order of the host
+TIME_COLUMN = struct.Struct('d')
+VALUE_COLUMN = struct.Struct('f')
+
+
+def numeric(value):
+    """
+    The value as a float, None for values the history can't keep (strings, None).
+
+    :param value: The driver value
+    """
+    if isinstance(value, float): return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RingBuffer(object):
+    """
+    Fixed size history of one driver, kept in two typed arrays (timestamps as doubles, values as
+    floats) that are allocated once and overwritten oldest first.
+
+    :param size: Number of samples kept
+    """
+    def __init__(self, size=HISTORY_SAMPLES):
+        self.size = max(1, size)
+        self.times = array('d', [0.0]) * self.size
+        self.values = array('f', [0.0]) * self.size
+        self.next = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value, timestamp=None):
+        """
+        Add a sample, replacing the oldest one once the buffer is full.
+
+        :param value: The value (int or float)
+        :param timestamp: Time of the sample (default: now)
+        """
+        with self.lock:
+            self.times[self.next] = time.time() if timestamp is None else timestamp
+            self.values[self.next] = value
+            self.next = (self.next + 1) % self.size
+            self.count = min(self.count + 1, self.size)
+
+    def ordered(self):
+        """
+        The (times, values) arrays of all the samples, oldest first.
+        """
+        with self.lock:
+            if self.count < self.size:
+                return self.times[:self.count], self.values[:self.count]
+            return (self.times[self.next:] + self.times[:self.next],
+                    self.values[self.next:] + self.values[:self.next])
+
+    def window(self, start=None, end=None):
+        """
+        The (times, values) arrays of the samples with start <= timestamp <= end, oldest first.
+
+        :param start: Earliest timestamp (default: the oldest sample)
+        :param end: Latest timestamp (default: the newest sample)
+        """
+        times, values = self.ordered()
+        first = 0 if start is None else bisect.bisect_left(times, start)
+        last = len(times) if end is None else bisect.bisect_right(times, end)
+        return times[first:last], values[first:last]
+
+    def latest(self):
+        """
+        The (timestamp, value) of the newest sample, None if there are none.
+        """
+        with self.lock:
+            if not self.count: return None
+            return self.times[self.next - 1], self.values[self.next - 1]
+
+    def memory(self):
+        """
+        Bytes used by the sample arrays.
+        """
+        return self.size * (self.times.itemsize + self.values.itemsize)
+
+
+class TelemetryHistory(object):
+    """
+    A RingBuffer for every (node address, driver), created on the first sample. Only numeric
+    values are kept.
+
+    :param samples: Number of samples kept per driver
+    """
+    def __init__(self, samples=HISTORY_SAMPLES):
+        self.samples = samples
+        self.buffers = {}
+        self.lock = threading.Lock()
+
+    def record(self, address, driver, value, timestamp=None):
+        """
+        Add a sample of a driver. Returns False for values that can't be kept (strings, None).
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        :param value: The value
+        :param timestamp: Time of the sample (default: now)
+        """
+        value = numeric(value)
+        if value is None: return False
+        key = (address, driver)
+        buffer = self.buffers.get(key)
+        if buffer is None:
+            with self.lock:
+                buffer = self.buffers.setdefault(key, RingBuffer(self.samples))
+        buffer.append(value, timestamp)
+        return True
+
+    def buffer(self, address, driver):
+        """
+        The RingBuffer of a driver, None if it has no samples.
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        """
+        return self.buffers.get((address, driver))
+
+    def window(self, address, driver, start=None, end=None):
+        """
+        The (times, values) arrays of a driver between start and end, empty arrays if it has no samples.
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        :param start: Earliest timestamp (default: the oldest sample)
+        :param end: Latest timestamp (default: the newest sample)
+        """
+        buffer = self.buffer(address, driver)
+        if buffer is None: return array('d'), array('f')
+        return buffer.window(start, end)
+
+    def last(self, address, driver, seconds):
+        """
+        The (times, values) arrays of a driver over the last `seconds` seconds.
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        :param seconds: Length of the window
+        """
+        return self.window(address, driver, time.time() - seconds)
+
+    def memory(self):
+        """
+        Bytes used by the sample arrays of all the drivers.
+        """
+        return sum(buffer.memory() for buffer in list(self.buffers.values()))
+
+
+class ColumnStore(object):
+    """
+    Append-only history of every driver on disk, rotated by day. Each day is a directory and
+    each driver has two fixed width column files in it, <node>.<driver>.time (doubles) and
+    <node>.<driver>.value (floats), so a sample costs two small buffered writes. Call flush()
+    once per poll. Columns are read back memory-mapped, range queries slice them without copying.
+
+    :param path: Directory of the history
+    :param keep: Days to keep, 0 to keep everything
+    """
+    def __init__(self, path, keep=HISTORY_KEEP_DAYS):
+        self.path = path
+        self.keep = keep
+        self.files = {}
+        self.day = None
+        self.day_end = 0
+        self.samples = 0
+        self.lock = threading.RLock()
+
+    def fileName(self, address, driver):
+        """
+        Column file name (without extension) of a driver, the node address stripped to safe characters.
+        """
+        return '%s.%s' % (re.sub(r'[^A-Za-z0-9_-]', '', address) or 'node', driver)
+
+    def rotate(self, timestamp):
+        """
+        Close the column files of the previous day and start the directory of the day of timestamp.
+        Days past the retention are deleted.
+
+        :param timestamp: Time of the first sample of the new day
+        """
+        self.close()
+        local = time.localtime(timestamp)
+        self.day = time.strftime('%Y-%m-%d', local)
+        self.day_end = time.mktime((local.tm_year, local.tm_mon, local.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+        directory = os.path.join(self.path, self.day)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        if self.keep:
+            for day in self.days()[:-self.keep]:
+                shutil.rmtree(os.path.join(self.path, day), ignore_errors=True)
+
+    def append(self, address, driver, value, timestamp=None):
+        """
+        Append a sample of a driver. Returns False for values that can't be kept (strings, None).
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        :param value: The value
+        :param timestamp: Time of the sample (default: now)
+        """
+        value = numeric(value)
+        if value is None: return False
+        if timestamp is None: timestamp = time.time()
+        with self.lock:
+            if timestamp >= self.day_end:
+                self.rotate(timestamp)
+            key = (address, driver)
+            files = self.files.get(key)
+            if files is None:
+                name = os.path.join(self.path, self.day, self.fileName(address, driver))
+                files = self.files[key] = self.openColumns(name)
+            files[0].write(TIME_COLUMN.pack(timestamp))
+            files[1].write(VALUE_COLUMN.pack(value))
+            self.samples += 1
+        return True
+
+    def openColumns(self, name):
+        """
+        Open the column files of a driver for appending. Both are first cut to the whole samples they
+        have in common, so a sample a crash left in only one of them can't pair the times written after
+        it with the wrong values.
+
+        :param name: Column file name with its directory, without extension
+        """
+        columns = ((name + '.time', TIME_COLUMN), (name + '.value', VALUE_COLUMN))
+        count = min((os.path.getsize(path) if os.path.exists(path) else 0) // fmt.size for path, fmt in columns)
+        files = []
+        for path, fmt in columns:
+            f = open(path, 'ab')
+            if f.tell() != count * fmt.size:
+                f.truncate(count * fmt.size)
+                f.seek(0, os.SEEK_END)
+            files.append(f)
+        return tuple(files)
+
+    def flush(self):
+        """
+        Write the buffered samples to the column files.
+        """
+        with self.lock:
+            for files in self.files.values():
+                files[0].flush()
+                files[1].flush()
+
+    def close(self):
+        """
+        Flush and close all the column files.
+        """
+        with self.lock:
+            for files in self.files.values():
+                files[0].close()
+                files[1].close()
+            self.files = {}
+
+    def days(self):
+        """
+        The days with history, oldest first.
+        """
+        if not os.path.isdir(self.path): return []
+        return sorted(day for day in os.listdir(self.path) if re.match(r'^\d{4}-\d{2}-\d{2}$', day))
+
+    def column(self, name, fmt):
+        """
+        Map a column file read-only. Returns (mmap, number of values), None for a missing or empty file.
+        """
+        if not os.path.exists(name) or os.path.getsize(name) < fmt.size: return None
+        with open(name, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return data, len(data) // fmt.size
+
+    def segments(self, address, driver, start=None, end=None):
+        """
+        The samples of a driver between start and end, as one (times, values) pair per day, oldest
+        first. With NumPy these are arrays over the mapped files, without it memoryviews (Python 3)
+        or arrays.
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        :param start: Earliest timestamp (default: the oldest sample)
+        :param end: Latest timestamp (default: the newest sample)
+        """
+        self.flush()
+        first = time.strftime('%Y-%m-%d', time.localtime(start)) if start is not None else None
+        last = time.strftime('%Y-%m-%d', time.localtime(end)) if end is not None else None
+        segments = []
+        for day in self.days():
+            if (first and day < first) or (last and day > last): continue
+            name = os.path.join(self.path, day, self.fileName(address, driver))
+            times, values = self.column(name + '.time', TIME_COLUMN), self.column(name + '.value', VALUE_COLUMN)
+            if times is None or values is None: continue
+            # Until the day is reopened, a crash can leave a sample in only one of the columns
+            count = min(times[1], values[1])
+            times, values = view(times[0], 'd', count), view(values[0], 'f', count)
+            lo = 0 if start is None else searchSorted(times, start, 'left')
+            hi = count if end is None else searchSorted(times, end, 'right')
+            if hi > lo:
+                segments.append((times[lo:hi], values[lo:hi]))
+        return segments
+
+    def read(self, address, driver, start=None, end=None):
+        """
+        The (times, values) of a driver between start and end. Zero copy when the range is within
+        one day, ranges over several days are joined into new arrays.
+
+        :param address: The node address
+        :param driver: The driver, e.g. 'GV1'
+        :param start: Earliest timestamp (default: the oldest sample)
+        :param end: Latest timestamp (default: the newest sample)
+        """
+        segments = self.segments(address, driver, start, end)
+        if len(segments) == 1: return segments[0]
+        if numpy is not None:
+            if not segments: return numpy.zeros(0, 'd'), numpy.zeros(0, 'f')
+            return (numpy.concatenate([times for times, values in segments]),
+                    numpy.concatenate([values for times, values in segments]))
+        times, values = array('d'), array('f')
+        for segment in segments:
+            times.extend(segment[0])
+            values.extend(segment[1])
+        return times, values
+
+
+def view(data, typecode, count):
+    """
+    The first count values of a mapped column file, without copying where possible.
+
+    :param data: The mmap of the column file
+    :param typecode: 'd' or 'f'
+    :param count: Number of values
+    """
+    if numpy is not None:
+        return numpy.frombuffer(data, dtype=typecode, count=count)
+    if hasattr(memoryview, 'cast'):
+        return memoryview(data)[:count * struct.calcsize(typecode)].cast(typecode)
+    values = array(typecode)
+    values.fromstring(data[:count * values.itemsize])
+    return values
+
+def searchSorted(times, timestamp, side):
+    """
+    Index of timestamp in a sorted column (bisect_left for 'left', bisect_right for 'right').
+    """
+    if numpy is not None:
+        return int(numpy.searchsorted(times, timestamp, side))
+    if side == 'left':
+        return bisect.bisect_left(times, timestamp)
+    return bisect.bisect_right(times, timestamp)
@@ -0,0 +1,173 @@
+"""
+Prometheus text format endpoint with the latest polled values and the poller and Modbus metrics.
+"""
+
+import re
+import threading
+from outback_defs import *
+from outback_history import numeric
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def label(value):
+    """
+    Escape a label value for the text format, control characters (like the NUL padding of
+    the AXS Port serial number) are dropped.
+
+    :param value: The label value
+    """
+    value = re.sub(r'[\x00-\x1f]', '', str(value))
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+def labels(**kwargs):
+    return '{' + ','.join('%s="%s"' % (key, label(value)) for key, value in sorted(kwargs.items())) + '}'
+
+def number(value):
+    return repr(float(value))
+
+
+class MetricsWriter(object):
+    """
+    Collects the lines of one scrape, each metric family with its HELP and TYPE lines once.
+    """
+    def __init__(self):
+        self.families = []
+        self.samples = {}
+
+    def add(self, metric, kind, help, value, **tags):
+        if metric not in self.samples:
+            self.families.append((metric, kind, help))
+            self.samples[metric] = []
+        self.samples[metric].append('%s%s %s' % (metric, labels(**tags) if tags else '', number(value)))
+
+    def histogram(self, metric, help, summary, **tags):
+        """
+        Add a histogram from a Histogram.summary() of outback_metrics.
+        """
+        if metric not in self.samples:
+            self.families.append((metric, 'histogram', help))
+            self.samples[metric] = []
+        lines = self.samples[metric]
+        for bound, count in summary['buckets']:
+            lines.append('%s_bucket%s %s' % (metric, labels(le=number(bound), **tags), number(count)))
+        lines.append('%s_bucket%s %s' % (metric, labels(le='+Inf', **tags), number(summary['count'])))
+        lines.append('%s_sum%s %s' % (metric, labels(**tags), number(summary['mean'] * summary['count'])))
+        lines.append('%s_count%s %s' % (metric, labels(**tags), number(summary['count'])))
+
+    def text(self):
+        output = []
+        for metric, kind, help in self.families:
+            output.append('# HELP %s %s' % (metric, help))
+            output.append('# TYPE %s %s' % (metric, kind))
+            output.extend(self.samples[metric])
+        return '\n'.join(output) + '\n'
+
+
+def renderMetrics(nodeserver):
+    """
+    The scrape of a node server in the Prometheus text format. Everything comes from what the last
+    polls left in memory, a scrape never sends a Modbus request.
+
+    :param nodeserver: The OutbackNodeServer
+    """
+    out = MetricsWriter()
+    for node in nodeserver.all_nodes():
+        registers = dict(node.registers)
+        for i, register in enumerate(node.registers_needed):
+            value = numeric(registers.get(register))
+            if value is None: continue
+            out.add('outback_driver_value', 'gauge', 'Latest value polled for a node driver', value,
+                    node=node.address, name=node.name, driver='GV' + str(i + 1), register=register)
+        out.add('outback_driver_updates_sent_total', 'counter', 'Driver updates sent to the ISY',
+                getattr(node, 'updates_sent', 0), node=node.address)
+        out.add('outback_driver_updates_suppressed_total', 'counter', 'Driver updates within the deadband',
+                getattr(node, 'updates_suppressed', 0), node=node.address)
+    poller = nodeserver.poller
+    if poller is not None:
+        out.add('outback_poll_cycles_total', 'counter', 'Long polls run', poller.cycles)
+        out.add('outback_refreshes_shared_total', 'counter', 'Node refreshes that waited for one already running',
+                poller.flights.stats()['shared'])
+        report = poller.last_report
+        if report is not None:
+            out.add('outback_poll_cycle_seconds', 'gauge', 'Time of the last long poll', report['cycle'])
+            out.add('outback_poll_errors', 'gauge', 'Nodes that failed to refresh on the last long poll',
+                    len(report['errors']))
+            for address, seconds in sorted(report['nodes'].items()):
+                out.add('outback_poll_node_seconds', 'gauge', 'Refresh time of each node on the last long poll',
+                        seconds, node=address)
+    for controller in nodeserver.controllers:
+        session = controller.session
+        gateway = '%s:%s' % (session.host, session.port)
+        stats = session.metrics.snapshot()
+        for method, count in sorted(stats['requests'].items()):
+            out.add('outback_modbus_requests_total', 'counter', 'Modbus requests sent', count,
+                    gateway=gateway, method=method)
+        for key, help in (('failures', 'Modbus requests that failed'),
+                          ('timeouts', 'Modbus requests that timed out'),
+                          ('exceptions', 'Modbus requests that raised or got a Modbus exception'),
+                          ('reconnects', 'Connections to the AXS Port re-opened'),
+                          ('registers', 'Registers read or written'),
+                          ('bytes_sent', 'Modbus TCP bytes sent'),
+                          ('bytes_received', 'Modbus TCP bytes received')):
+            out.add('outback_modbus_%s_total' % key, 'counter', help, stats[key], gateway=gateway)
+        out.add('outback_modbus_reads_shared_total', 'counter', 'Reads answered by an identical read already in flight',
+                session.flights.stats()['shared'], gateway=gateway)
+        out.histogram('outback_modbus_request_seconds', 'Modbus request latency', stats['latency'], gateway=gateway)
+        for model, summary in sorted(stats['models'].items()):
+            out.histogram('outback_modbus_model_request_seconds', 'Modbus request latency by SunSpec model',
+                          summary, gateway=gateway, model=model)
+    return out.text()
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serves /metrics, everything else is a 404.
+    """
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+        try:
+            body = renderMetrics(self.server.nodeserver).encode('utf-8')
+        except Exception:
+            self.server.nodeserver.poly.logger.exception('Failed to render metrics')
+            self.send_error(500)
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.server.nodeserver.poly.logger.debug('Metrics: ' + format, *args)
+
+
+class MetricsServer(ThreadingMixIn, HTTPServer):
+    """
+    HTTP server for the metrics endpoint, serving from a background thread.
+
+    :param nodeserver: The OutbackNodeServer to report on
+    :param host: Address to listen on (localhost by default)
+    :param port: Port to listen on
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, nodeserver, host=METRICS_HOST, port=METRICS_PORT):
+        HTTPServer.__init__(self, (host, port), MetricsHandler)
+        self.nodeserver = nodeserver
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, name='metrics-http')
+        thread.daemon = True
+        thread.start()
+        return self.server_address
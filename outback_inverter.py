@@ -3,8 +3,13 @@
       by Einstein.42(James Milne)
       milne.james@gmail.com"""
 
+import os
 from polyglot.nodeserver_api import SimpleNodeServer, PolyglotConnector
-from outback_types import OutbackNode
+from outback_defs import *
+from outback_types import OutbackNode, gatewayPrefix
+from outback_poller import PollEngine
+from outback_history import TelemetryHistory, ColumnStore
+from outback_http import MetricsServer
 
 VERSION = "0.1.2"
 
@@ -12,48 +17,79 @@ VERSION = "0.1.2"
 class OutbackNodeServer(SimpleNodeServer):
     """This is a comment for the NodeServer"""
     controller = None
-    inverter_master = None
-    inverter_slaves = []
-    sunspec = None
-    flexnet = None
+    controllers = []
+    gateways = GATEWAYS
+    poller = None
+    history = None
+    store = None
+    metrics_server = None
 
     def setup(self):
         manifest = self.config.get('manifest',{})
         self.poly.logger.info("FROM Poly ISYVER: %s", self.poly.isyver)        
-        self.controller = OutbackNode(self,'outbackaxs','Outback Control', True, manifest)
-        self.controller.addInverters(self.controller)
-        # Close active connection. We don't keep it open if we don't need it.
-        self.controller.closeConnection()
+        self.poller = PollEngine(self.poly.logger, POLL_WORKERS * len(self.gateways))
+        if HISTORY_SAMPLES:
+            self.history = TelemetryHistory(HISTORY_SAMPLES)
+        if HISTORY_DIR:
+            self.store = ColumnStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), HISTORY_DIR))
+        self.controllers = []
+        for index, (host, port) in enumerate(self.gateways):
+            # Nodes of the first AXS Port keep their addresses, the others get a one character prefix
+            prefix = gatewayPrefix(index)
+            controller = OutbackNode(self, prefix + 'outbackaxs', 'Outback Control', True, manifest, host, port, prefix)
+            if not controller.ready:
+                self.poly.logger.error('Skipping AXS Port %s:%s', host, port)
+                continue
+            self.controllers.append(controller)
+            controller.addInverters(controller)
+        if self.controllers:
+            self.controller = self.controllers[0]
+        if METRICS_PORT and self.metrics_server is None:
+            try:
+                self.metrics_server = MetricsServer(self, METRICS_HOST, METRICS_PORT)
+                self.poly.logger.info('Serving metrics on http://%s:%s/metrics', *self.metrics_server.start())
+            except (IOError, OSError) as e:
+                self.poly.logger.error('Failed to start the metrics endpoint on port %s: %s', METRICS_PORT, e)
         self.update_config()
         
     def poll(self):
         pass
 
     def long_poll(self):
-        if self.controller is not None:
-            self.controller.update_info()
-        if self.inverter_master is not None:
-            self.inverter_master.update_info()
-        if len(self.inverter_slaves) >= 1:
-            for i in self.inverter_slaves:
-                i.update_info()
-        if self.sunspec is not None:
-            self.sunspec.update_info()
-        if self.flexnet is not None:
-            self.flexnet.update_info()
+        if self.poller is None:
+            self.poller = PollEngine(self.poly.logger, POLL_WORKERS * len(self.gateways))
+        report = self.poller.run(self.all_nodes())
+        if self.store is not None:
+            self.store.flush()
+        self.poly.logger.info('Poll cycle took %.2fs for %i nodes (%.2fs of node refresh time)',
+                              report['cycle'], len(report['nodes']), report['serial'])
+        self.poly.logger.info('Driver updates: %i sent, %i suppressed by deadbands',
+                              sum(report['sent'].values()), sum(report['suppressed'].values()))
+        if METRICS_LOG_CYCLES and self.poller.cycles % METRICS_LOG_CYCLES == 0:
+            for controller in self.controllers:
+                controller.logMetrics()
+        return report
+
+    def all_nodes(self):
+        nodes = []
+        for controller in self.controllers:
+            nodes.extend(controller.nodes())
+        return nodes
 
     def report_drivers(self):
-        if self.controller is not None:
-            self.controller.report_driver()
-        if self.inverter_master is not None:
-            self.inverter_master.report_driver()
-        if len(self.inverter_slaves) >= 1:
-            for i in self.inverter_slaves:
-                i.report_driver()
-        if self.sunspec is not None:
-            self.sunspec.report_driver()
-        if self.flexnet is not None:
-            self.flexnet.report_driver()
+        for node in self.all_nodes():
+            node.report_driver()
+
+    def query(self, nodes=None, delay=QUERY_REPORT_DELAY):
+        """
+        Refresh and report nodes (default: all of them) in the background. Returns at once.
+
+        :param nodes: The nodes to refresh
+        :param delay: Seconds before the drivers are reported again, 0 to report them once
+        """
+        if self.poller is None:
+            self.poller = PollEngine(self.poly.logger, POLL_WORKERS * len(self.gateways))
+        return self.poller.query(self.all_nodes() if nodes is None else nodes, delay)
 
     
 def main():
@@ -0,0 +1,184 @@
+"""
+Latency histograms and counters of the Modbus requests sent to an AXS Port.
+"""
+
+import bisect
+import threading
+from outback_defs import *
+
+# Node refreshing on the current thread, requests made while it is set are counted for that node
+_context = threading.local()
+
+
+def setNode(address):
+    """
+    Count the Modbus requests made from this thread for a node.
+
+    :param address: The node address, None to stop counting per node
+    """
+    _context.node = address
+
+def currentNode():
+    return getattr(_context, 'node', None)
+
+def frameBytes(method, count):
+    """
+    Bytes (sent, received) on the wire for a Modbus TCP request and its response.
+
+    :param method: Name of the ModbusClient method
+    :param count: Number of registers read or written
+    """
+    if method == 'read_holding_registers':
+        return 12, 9 + 2 * count
+    if method == 'write_multiple_registers':
+        return 13 + 2 * count, 12
+    return 12, 12
+
+
+class Histogram(object):
+    """
+    Request latency histogram with fixed bucket bounds.
+
+    :param buckets: Upper bounds of the buckets in seconds, the last bucket is everything above them
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction):
+        """
+        Upper bound of the bucket the given fraction of requests fall within (max for the last bucket).
+
+        :param fraction: 0.5 for the median, 0.95 for the 95th percentile...
+        """
+        if not self.count: return 0.0
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= fraction * self.count:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        """
+        {'count', 'mean', 'p50', 'p95', 'max', 'buckets': [(upper bound, cumulative count), ...]}
+        """
+        cumulative, buckets = 0, []
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {'count': self.count, 'mean': self.total / self.count if self.count else 0.0,
+                'p50': self.percentile(0.5), 'p95': self.percentile(0.95), 'max': self.max,
+                'buckets': buckets}
+
+
+class ModbusMetrics(object):
+    """
+    Counters and latency histograms for the Modbus requests of one ModbusSession: overall, per
+    SunSpec model (by the register address) and per node (the node refreshing when the request
+    was made). Safe to update from any number of threads.
+
+    :param buckets: Upper bounds of the latency buckets in seconds
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.lock = threading.Lock()
+        self.latency = Histogram(buckets)
+        self.models = {}
+        self.nodes = {}
+        self.requests = {}
+        self.registers = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.exceptions = 0
+        self.connects = 0
+        self.reconnects = 0
+
+    def record(self, method, count, seconds, success=True, model=None, timeout=False, exception=False):
+        """
+        Count one request.
+
+        :param method: Name of the ModbusClient method
+        :param count: Number of registers read or written
+        :param seconds: Time the request took
+        :param success: False if the request failed
+        :param model: SunSpec model DID the registers belong to, None if unknown
+        :param timeout: True if the request failed with a timeout
+        :param exception: True if the client raised or the AXS Port sent a Modbus exception
+        """
+        node = currentNode()
+        sent, received = frameBytes(method, count)
+        with self.lock:
+            self.requests[method] = self.requests.get(method, 0) + 1
+            self.latency.observe(seconds)
+            if model is not None:
+                if model not in self.models:
+                    self.models[model] = Histogram(self.buckets)
+                self.models[model].observe(seconds)
+            if node is not None:
+                if node not in self.nodes:
+                    self.nodes[node] = Histogram(self.buckets)
+                self.nodes[node].observe(seconds)
+            self.bytes_sent += sent
+            if success:
+                self.registers += count
+                self.bytes_received += received
+            else:
+                self.failures += 1
+                self.timeouts += int(timeout)
+                self.exceptions += int(exception)
+
+    def connected(self, reconnect=False):
+        """
+        Count a connection to the AXS Port.
+
+        :param reconnect: True if a connection that was open before was re-opened
+        """
+        with self.lock:
+            self.connects += 1
+            self.reconnects += int(reconnect)
+
+    def snapshot(self):
+        """
+        All the counters with the latency summaries, overall and by model and node.
+        """
+        with self.lock:
+            return {'requests': dict(self.requests), 'registers': self.registers,
+                    'bytes_sent': self.bytes_sent, 'bytes_received': self.bytes_received,
+                    'failures': self.failures, 'timeouts': self.timeouts, 'exceptions': self.exceptions,
+                    'connects': self.connects, 'reconnects': self.reconnects,
+                    'latency': self.latency.summary(),
+                    'models': dict((model, h.summary()) for model, h in self.models.items()),
+                    'nodes': dict((node, h.summary()) for node, h in self.nodes.items())}
+
+    def log(self, logger, name):
+        """
+        Write the metrics to the log, one line overall and one per model and node.
+
+        :param logger: The logger to write to
+        :param name: Name of the AXS Port in the log lines
+        """
+        stats = self.snapshot()
+        latency = stats['latency']
+        logger.info('Modbus %s: %i requests, %i failed (%i timeouts, %i exceptions), %i reconnects, '
+                    '%i bytes sent, %i received, latency mean %.1fms p50 %.1fms p95 %.1fms max %.1fms',
+                    name, latency['count'], stats['failures'], stats['timeouts'], stats['exceptions'],
+                    stats['reconnects'], stats['bytes_sent'], stats['bytes_received'], latency['mean'] * 1000,
+                    latency['p50'] * 1000, latency['p95'] * 1000, latency['max'] * 1000)
+        for label, group in (('model', stats['models']), ('node', stats['nodes'])):
+            for key, latency in sorted(group.items()):
+                logger.info('Modbus %s %s %s: %i requests, latency mean %.1fms p50 %.1fms p95 %.1fms max %.1fms',
+                            name, label, key, latency['count'], latency['mean'] * 1000,
+                            latency['p50'] * 1000, latency['p95'] * 1000, latency['max'] * 1000)
+        return stats
@@ -0,0 +1,187 @@
+"""
+Modbus TCP client that can pipeline several requests on one connection.
+"""
+
+import socket
+import struct
+
+
+class ModbusError(Exception):
+    pass
+
+
+class PipelinedClient(object):
+    """
+    Minimal Modbus TCP client (function codes 3, 6 and 16) with the same methods
+    as pyModbusTCP's ModbusClient, plus read_many() which keeps up to `depth`
+    requests outstanding on the connection. Every request carries its own MBAP
+    transaction ID, so responses are matched even if they come back out of order.
+    If the gateway drops the connection or stops answering while requests are
+    pipelined, the client reconnects and falls back to strict request/response.
+
+    :param host: IP Address of the Modbus device
+    :param port: Modbus TCP port
+    :param timeout: Socket timeout in seconds
+    :param depth: Maximum number of requests outstanding at once
+    :param unit_id: Modbus unit ID
+    """
+    def __init__(self, host='localhost', port=502, timeout=10, depth=8, unit_id=1):
+        self.__host = host
+        self.__port = int(port)
+        self.__timeout = timeout
+        self.depth = max(1, depth)
+        self.unit_id = unit_id
+        self.pipelining = self.depth > 1
+        self.sock = None
+        self.tid = 0
+        self.error = None
+
+    def host(self, host=None):
+        if host is not None:
+            self.__host = host
+        return self.__host
+
+    def port(self, port=None):
+        if port is not None:
+            self.__port = int(port)
+        return self.__port
+
+    def timeout(self, timeout=None):
+        if timeout is not None:
+            self.__timeout = timeout
+        return self.__timeout
+
+    def open(self):
+        if self.sock is not None:
+            return True
+        try:
+            self.sock = socket.create_connection((self.__host, self.__port), self.__timeout)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (socket.error, socket.timeout) as e:
+            self.error = str(e)
+            self.sock = None
+            return False
+        return True
+
+    def is_open(self):
+        return self.sock is not None
+
+    def close(self):
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except socket.error:
+                pass
+        self.sock = None
+
+    def send(self, pdu):
+        """
+        Send one request and return its transaction ID.
+
+        :param pdu: The Modbus PDU (function code and data)
+        """
+        self.tid = (self.tid + 1) & 0xFFFF
+        self.sock.sendall(struct.pack('>HHHB', self.tid, 0, len(pdu) + 1, self.unit_id) + pdu)
+        return self.tid
+
+    def recvAll(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.sock.recv(size - len(data))
+            if not chunk:
+                raise ModbusError('Connection closed by the gateway')
+            data += chunk
+        return data
+
+    def receive(self):
+        """
+        Receive the next response, returns (transaction ID, pdu).
+        """
+        tid, pid, length, unit = struct.unpack('>HHHB', self.recvAll(7))
+        if pid != 0 or length < 2:
+            raise ModbusError('Invalid MBAP header')
+        return tid, self.recvAll(length - 1)
+
+    def transact(self, pdu):
+        """
+        Send one request and wait for its response (strict request/response).
+        Returns the response PDU, or None on a socket error (the socket is closed).
+        """
+        self.error = None
+        if not self.open():
+            return None
+        try:
+            tid = self.send(pdu)
+            while True:
+                rtid, response = self.receive()
+                if rtid == tid:
+                    return response
+        except (socket.error, socket.timeout, ModbusError) as e:
+            self.error = str(e)
+            self.close()
+            return None
+
+    def decodeRead(self, pdu, count):
+        """
+        Registers from a function 3 response PDU, None for an exception response.
+        """
+        if pdu is None or len(pdu) < 2 or ord(pdu[0:1]) != 3:
+            if pdu is not None and len(pdu) >= 2:
+                self.error = 'Modbus exception %i' % ord(pdu[1:2])
+            return None
+        if ord(pdu[1:2]) != count * 2 or len(pdu) < 2 + count * 2:
+            self.error = 'Short read response'
+            return None
+        return list(struct.unpack('>%iH' % count, pdu[2:2 + count * 2]))
+
+    def read_holding_registers(self, address, count=1):
+        return self.decodeRead(self.transact(struct.pack('>BHH', 3, address, count)), count)
+
+    def write_single_register(self, address, value):
+        pdu = struct.pack('>BHH', 6, address, int(value) & 0xFFFF)
+        return True if self.transact(pdu) == pdu else None
+
+    def write_multiple_registers(self, address, values):
+        values = [int(v) & 0xFFFF for v in values]
+        pdu = struct.pack('>BHHB%iH' % len(values), 16, address, len(values), len(values) * 2, *values)
+        response = self.transact(pdu)
+        if response is None or ord(response[0:1]) != 16:
+            return None
+        return True
+
+    def read_many(self, requests):
+        """
+        Read several register ranges, pipelining the requests when the gateway allows it.
+        Returns a list with the registers (None for a failed read) of each request, in order.
+
+        :param requests: List of (address, count) tuples
+        """
+        self.error = None
+        results = [None] * len(requests)
+        if not self.pipelining or len(requests) < 2:
+            for i, (address, count) in enumerate(requests):
+                results[i] = self.read_holding_registers(address, count)
+            return results
+        if not self.open():
+            return results
+        pending = {}
+        sent = 0
+        try:
+            while sent < len(requests) or pending:
+                while sent < len(requests) and len(pending) < self.depth:
+                    pending[self.send(struct.pack('>BHH', 3, *requests[sent]))] = sent
+                    sent += 1
+                tid, pdu = self.receive()
+                i = pending.pop(tid, None)
+                if i is not None:
+                    results[i] = self.decodeRead(pdu, requests[i][1])
+        except (socket.error, socket.timeout, ModbusError) as e:
+            # The gateway doesn't cope with more than one outstanding request,
+            # redo what's left one request at a time from now on.
+            self.error = str(e)
+            if len(pending) > 1:
+                self.pipelining = False
+            self.close()
+            for i in sorted(list(pending.values()) + list(range(sent, len(requests)))):
+                results[i] = self.read_holding_registers(*requests[i])
+        return results
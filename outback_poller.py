@@ -0,0 +1,123 @@
+"""
+Concurrent refresh of the OutBack nodes on each long poll.
+"""
+
+import threading
+import time
+from outback_defs import *
+from outback_flight import SingleFlight
+from outback_metrics import setNode
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+class PollEngine(object):
+    """
+    Refreshes nodes from a small pool of worker threads so one slow node doesn't
+    hold up the rest of the stack. All nodes share the controller's ModbusSession,
+    which bounds how many Modbus requests are actually in flight. A node is only refreshed by one
+    thread at a time: a long poll or QUERY that finds it already refreshing waits for that refresh.
+
+    :param logger: The logger to report failures to
+    :param workers: Maximum number of nodes refreshed at the same time
+    """
+    def __init__(self, logger, workers=POLL_WORKERS):
+        self.logger = logger
+        self.workers = max(1, workers)
+        self.cycles = 0
+        self.last_report = None
+        self.flights = SingleFlight()
+
+    def refresh(self, node, report):
+        start = time.time()
+        sent = getattr(node, 'updates_sent', 0)
+        suppressed = getattr(node, 'updates_suppressed', 0)
+        setNode(node.address)
+        try:
+            self.flights.do(node.address, node.update_info)
+        except Exception as e:
+            self.logger.exception('Failed to refresh %s', node.name)
+            report['errors'][node.address] = str(e)
+        finally:
+            setNode(None)
+        report['nodes'][node.address] = time.time() - start
+        report['sent'][node.address] = getattr(node, 'updates_sent', 0) - sent
+        report['suppressed'][node.address] = getattr(node, 'updates_suppressed', 0) - suppressed
+
+    def worker(self, pending, report):
+        while True:
+            try:
+                node = pending.get_nowait()
+            except queue.Empty:
+                return
+            self.refresh(node, report)
+
+    def run(self, nodes):
+        """
+        Refresh all the nodes and return the timing report for the cycle:
+        {'cycle': seconds, 'serial': sum of node seconds, 'nodes': {address: seconds}, 'errors': {address: error},
+         'sent': {address: driver updates sent}, 'suppressed': {address: driver updates within the deadband}}
+
+        :param nodes: List of nodes to refresh (anything with update_info())
+        """
+        report = self.refreshAll(nodes)
+        self.cycles += 1
+        self.last_report = report
+        return report
+
+    def refreshAll(self, nodes):
+        """
+        Refresh all the nodes on the worker threads and return the timing report, without counting
+        a poll cycle.
+
+        :param nodes: List of nodes to refresh (anything with update_info())
+        """
+        start = time.time()
+        report = {'cycle': 0.0, 'serial': 0.0, 'nodes': {}, 'errors': {}, 'sent': {}, 'suppressed': {}}
+        pending = queue.Queue()
+        for node in nodes:
+            pending.put(node)
+        threads = []
+        for i in range(min(self.workers, len(nodes))):
+            thread = threading.Thread(target=self.worker, args=(pending, report), name='poll-%i' % i)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        report['cycle'] = time.time() - start
+        report['serial'] = sum(report['nodes'].values())
+        return report
+
+    def query(self, nodes, delay=QUERY_REPORT_DELAY):
+        """
+        Answer an ISY QUERY without blocking the caller: the nodes are refreshed and their drivers
+        reported on a background thread, and reported again `delay` seconds later from a timer
+        (the ISY has a bad habit of missing some updates). Returns the background thread.
+
+        :param nodes: List of nodes to refresh and report (anything with update_info() and report_driver())
+        :param delay: Seconds before the drivers are reported again, 0 to report them once
+        """
+        thread = threading.Thread(target=self.answer, args=(nodes, delay), name='query')
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def answer(self, nodes, delay):
+        report = self.refreshAll(nodes)
+        self.logger.info('Query refreshed %i nodes in %.2fs', len(report['nodes']), report['cycle'])
+        self.reportDrivers(nodes)
+        if delay > 0:
+            timer = threading.Timer(delay, self.reportDrivers, [nodes])
+            timer.daemon = True
+            timer.start()
+
+    def reportDrivers(self, nodes):
+        for node in nodes:
+            try:
+                node.report_driver()
+            except Exception:
+                self.logger.exception('Failed to report %s', node.name)
@@ -0,0 +1,430 @@
+"""
+Long-lived Modbus TCP session to the OutBack AXS Port.
+"""
+
+import threading
+import time
+from outback_defs import *
+from outback_flight import SingleFlight
+from outback_metrics import ModbusMetrics
+from outback_pipeline import PipelinedClient
+from pyModbusTCP.client import ModbusClient
+from pyModbusTCP import constants
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+class ModbusSession(object):
+    """
+    Keeps Modbus TCP connections to the AXS Port open between polls and ISY
+    commands. The SunSpec verification and encryption key are remembered for the
+    life of the session, along with the devices discovered on the AXS Port, and a
+    dropped socket is re-opened transparently on the next request. Provides the same
+    read/write methods as ModbusClient so it can be used anywhere the client was, from any number of threads: each request borrows one of
+    at most `connections` sockets, which bounds the requests in flight. Every request is timed and
+    counted in `metrics` (a ModbusMetrics).
+
+    The connection, crypto and discovery state is only changed under `lock`. The device lists are
+    replaced by setDevices(), never changed in place, so a poll can iterate them while an ISY
+    command rescans, and close() leaves the sockets other threads are reading on open until they
+    are released. Identical reads in flight at the same time are only sent once (see read_many()).
+
+    :param logger: The logger to report connection events to
+    :param host: IP Address of the AXS Port
+    :param port: Modbus TCP port of the AXS Port
+    :param timeout: Socket timeout in seconds
+    :param connections: Maximum number of connections (and requests in flight)
+    :param transport: 'pymodbustcp' or 'pipelined' (see MODBUS_TRANSPORT)
+    """
+    def __init__(self, logger, host=DEVICEIP, port=DEVICEPORT, timeout=10, connections=MODBUS_CONNECTIONS,
+                 transport=MODBUS_TRANSPORT):
+        self.logger = logger
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.connections = max(1, connections)
+        self.transport = transport
+        self.clients = []
+        self.busy = set()
+        self.idle = queue.Queue()
+        self.slots = threading.Semaphore(self.connections)
+        self.lock = threading.RLock()
+        self.verified = False
+        self.encrypted = False
+        self.key = None
+        self.decrypt = None
+        self.encrypt = None
+        self.connects = 0
+        self.reconnects = 0
+        self.metrics = ModbusMetrics()
+        self.flights = SingleFlight()
+        # Discovery results, filled in by the OutbackNode of this AXS Port
+        self.devices = []
+        self.deployment_devices = []
+        self.config = None
+        self.phase = None
+        self.type = None
+        self.fndc = False
+        self.fndc_config = None
+
+    def acquire(self):
+        """
+        Borrow an idle client, creating one if we are below the connection limit.
+        """
+        self.slots.acquire()
+        try:
+            return self.borrow(self.idle.get_nowait())
+        except queue.Empty:
+            pass
+        with self.lock:
+            if len(self.clients) < self.connections:
+                if self.transport == 'pipelined':
+                    client = PipelinedClient(depth=PIPELINE_DEPTH)
+                else:
+                    client = ModbusClient()
+                client.host(self.host)
+                client.port(self.port)
+                client.timeout(self.timeout)
+                client.used = False
+                client.retired = False
+                client.closing = False
+                self.clients.append(client)
+                return self.borrow(client)
+        return self.borrow(self.idle.get())
+
+    def borrow(self, client):
+        with self.lock:
+            self.busy.add(client)
+        return client
+
+    def release(self, client):
+        with self.lock:
+            self.busy.discard(client)
+            if client.closing:
+                client.closing = False
+                client.close()
+        if not client.retired:
+            self.idle.put(client)
+        self.slots.release()
+
+    def connect(self, client):
+        """
+        Open a client if it isn't already. The first connection verifies the SunSpec
+        ID (and reads the encryption key), later ones reuse that result. Until the
+        session is verified, every connect tries the verification again.
+
+        :param client: The ModbusClient to open
+        """
+        if client.is_open():
+            if self.verified:
+                return True
+            with self.lock:
+                if not self.verified:
+                    self.verified = self.verify(client)
+                return self.verified
+        if not client.open():
+            with self.lock:
+                if not client.used and len(self.clients) > 1:
+                    # The AXS Port refused an extra connection, make do with the ones we have
+                    self.clients.remove(client)
+                    self.connections = len(self.clients)
+                    client.retired = True
+                    self.busy.discard(client)
+                    self.logger.info('Limiting AXS Port session to %i connections', self.connections)
+                    return False
+            self.logger.info('Connection unsuccessful. Check IP or port settings')
+            return False
+        with self.lock:
+            self.connects += 1
+            if client.used:
+                self.reconnects += 1
+                self.logger.info('Reconnected to AXS Port %s:%s (%i reconnects)', self.host, self.port, self.reconnects)
+            self.metrics.connected(client.used)
+            client.used = True
+            if not self.verified:
+                self.verified = self.verify(client)
+            return self.verified
+
+    def open(self):
+        """
+        Make sure the session can reach and has verified the AXS Port.
+        """
+        client = self.acquire()
+        try:
+            if not self.connect(client) and client.retired:
+                client = self.borrow(self.idle.get())
+                return self.connect(client)
+            return self.verified
+        finally:
+            self.release(client)
+
+    def verify(self, client=None):
+        """
+        Verify that the device returns the ID of a SunSpec device
+        0x53756E53 at the first 2 bits of register 40000
+
+        :param client: The ModbusClient to verify with (default: any)
+        """
+        if client is None:
+            client = self.acquire()
+            try:
+                if not client.is_open() and not client.open(): return False
+                with self.lock:
+                    return self.verify(client)
+            finally:
+                self.release(client)
+        try:
+            register = client.read_holding_registers(SUNSPEC_MODBUS_REGISTER_OFFSET - 1, 2)
+            sunSpecId = '0x{0:08X}'.format(register[0] << 16 | register[1])
+            if sunSpecId == SUNSPECID: return True
+        except:
+            self.logger.info('Trying Encrypted')
+        # Try Encrypted
+        if self.getEncryptionKey(client):
+            register = client.read_holding_registers(40000, 3)
+            if register is None:
+                self.logger.error('Failed to read the SunSpec ID, connection failed')
+                return False
+            register[1] = self.decrypt[register[1]]
+            sunSpecId = '0x{0:08X}'.format((register[0] << 16) | register[1])
+            if sunSpecId == SUNSPECID:
+                with self.lock:
+                    self.encrypted = True
+                return True
+            self.logger.info('Invalid register for SunSpec device type. 40000 should return 32-bit hex value of 0x53756E53')
+        return False
+
+    def getEncryptionKey(self, client=None):
+        """
+        Read the encryption key of the AXS Port and build the decrypt/encrypt tables for it. The
+        tables are swapped in together, so other threads never see a decrypt table of one key and an
+        encrypt table of another.
+
+        :param client: The ModbusClient to read with (default: any)
+        """
+        try:
+            if client is None:
+                key = self.read_holding_registers(40076, 1)[0]
+            else:
+                key = client.read_holding_registers(40076, 1)[0]
+            self.logger.debug('Encryption Key Found: %i', key)
+            with self.lock:
+                if self.decrypt is None or self.decrypt[ENCRYPT(key, 0)] != 0:
+                    self.decrypt, self.encrypt = DECRYPT_TABLE(key), ENCRYPT_TABLE(key)
+                self.key = key
+            return True
+        except TypeError as e:
+            self.logger.error('Failed to get Encryption Key, connection failed')
+            return False
+
+    def table(self):
+        """
+        The decrypt table to decode registers with, None if the AXS Port isn't encrypted
+        """
+        return self.decrypt if self.encrypted else None
+
+    def encryptTable(self):
+        """
+        The encrypt table to write registers with, None if the AXS Port isn't encrypted
+        """
+        return self.encrypt if self.encrypted else None
+
+    def setDevices(self, devices):
+        """
+        Replace the discovered devices (and the list of their model DIDs) with a new list.
+
+        :param devices: List of SunSpecDevice
+        """
+        with self.lock:
+            self.devices = devices
+            self.deployment_devices = [device.type for device in devices]
+
+    def setDeployment(self, phase, type, config, fndc_config):
+        """
+        Set the deployment found by discovery in one step.
+
+        :param phase: 'Single', 'Split', 'Three' or None
+        :param type: 'FX', 'GS' or None
+        :param config: The DID of the inverter config model
+        :param fndc_config: The DID of the FLEXnet-DC config model, None without one
+        """
+        with self.lock:
+            self.phase = phase
+            self.type = type
+            self.config = config
+            self.fndc = fndc_config is not None
+            self.fndc_config = fndc_config
+
+    def modelAt(self, address):
+        """
+        The SunSpec model DID of the discovered device a register address belongs to, None if unknown
+
+        :param address: The register address
+        """
+        for device in self.devices:
+            if device.addr <= address < device.addr + device.offset + 2:
+                return device.type
+        return None
+
+    def timedOut(self, client):
+        """
+        True if the last failed request of the client timed out
+
+        :param client: The ModbusClient or PipelinedClient
+        """
+        if isinstance(client, PipelinedClient):
+            return client.error is not None and 'timed out' in client.error
+        return client.last_error() == constants.MB_TIMEOUT_ERR
+
+    def failedWithException(self, client):
+        """
+        True if the last failed request of the client got a Modbus exception response
+
+        :param client: The ModbusClient or PipelinedClient
+        """
+        if isinstance(client, PipelinedClient):
+            return client.error is not None and client.error.startswith('Modbus exception')
+        return client.last_error() == constants.MB_EXCEPT_ERR
+
+    def record(self, client, method, address, count, seconds, result):
+        """
+        Count a request in the session metrics
+
+        :param client: The client the request was sent on
+        :param method: Name of the ModbusClient method
+        :param address: First register of the request
+        :param count: Number of registers read or written
+        :param seconds: Time the request took
+        :param result: The result of the request, None if it failed
+        """
+        failed = result is None
+        self.metrics.record(method, count, seconds, not failed, self.modelAt(address),
+                            failed and self.timedOut(client), failed and self.failedWithException(client))
+
+    def request(self, method, *args):
+        """
+        Run a ModbusClient request on a borrowed connection, re-opening it and
+        retrying once if the socket was dropped.
+
+        :param method: Name of the ModbusClient method to call
+        :param args: Arguments for the method
+        """
+        client = self.acquire()
+        try:
+            for attempt in range(2):
+                if not self.connect(client):
+                    if not client.retired:
+                        return None
+                    client = self.borrow(self.idle.get())
+                    if not self.connect(client):
+                        return None
+                start = time.time()
+                try:
+                    result = getattr(client, method)(*args)
+                except Exception:
+                    self.metrics.record(method, requestSize(method, args), time.time() - start, False,
+                                        self.modelAt(args[0]), exception=True)
+                    raise
+                self.record(client, method, args[0], requestSize(method, args), time.time() - start, result)
+                if result is not None or client.is_open():
+                    return result
+                self.logger.info('Lost connection to AXS Port %s:%s', self.host, self.port)
+            return None
+        finally:
+            self.release(client)
+
+    def read_many(self, requests):
+        """
+        Read several register ranges on one borrowed connection, pipelined if the
+        transport supports it. Reads lost to a dropped socket are retried on a fresh
+        connection. Returns the registers (None for a failed read) of each request.
+        Pipelined reads are counted in the metrics with their share of the time of the batch.
+        A range another thread is already reading isn't read again, its result is shared.
+
+        :param requests: List of (address, count) tuples
+        """
+        claims = [self.flights.claim(request) for request in requests]
+        mine = [i for i, (flight, leader) in enumerate(claims) if leader]
+        results = [None] * len(requests)
+        try:
+            for i, result in zip(mine, self.readBatch([requests[i] for i in mine]) if mine else []):
+                results[i] = result
+        finally:
+            for i in mine:
+                self.flights.finish(requests[i], claims[i][0], results[i])
+        for i, (flight, leader) in enumerate(claims):
+            if not leader:
+                results[i] = flight.wait()
+        return results
+
+    def readBatch(self, requests):
+        """
+        read_many() without the sharing of reads in flight.
+
+        :param requests: List of (address, count) tuples
+        """
+        results = [None] * len(requests)
+        client = self.acquire()
+        try:
+            if self.connect(client):
+                if hasattr(client, 'read_many'):
+                    start = time.time()
+                    results = client.read_many(requests)
+                    share = (time.time() - start) / max(1, len(requests))
+                    for (address, count), result in zip(requests, results):
+                        self.record(client, 'read_holding_registers', address, count, share, result)
+                else:
+                    for i, (address, count) in enumerate(requests):
+                        start = time.time()
+                        results[i] = client.read_holding_registers(address, count)
+                        self.record(client, 'read_holding_registers', address, count, time.time() - start, results[i])
+            dropped = not client.is_open()
+        finally:
+            self.release(client)
+        if dropped:
+            for i, result in enumerate(results):
+                if result is None:
+                    results[i] = self.read_holding_registers(*requests[i])
+        return results
+
+    def read_holding_registers(self, address, count=1):
+        return self.request('read_holding_registers', address, count)
+
+    def write_single_register(self, address, value):
+        return self.request('write_single_register', address, value)
+
+    def write_multiple_registers(self, address, values):
+        return self.request('write_multiple_registers', address, values)
+
+    def is_open(self):
+        return any(client.is_open() for client in self.clients)
+
+    def close(self):
+        """
+        Close all the sockets. Sockets other threads are using are closed when they are released.
+        The verified state is kept so the next request reconnects without repeating the SunSpec
+        handshake.
+        """
+        with self.lock:
+            for client in self.clients:
+                if client in self.busy:
+                    client.closing = True
+                else:
+                    client.close()
+
+
+def requestSize(method, args):
+    """
+    Number of registers a ModbusClient request reads or writes
+
+    :param method: Name of the ModbusClient method
+    :param args: Arguments of the request
+    """
+    if method == 'read_holding_registers':
+        return args[1] if len(args) > 1 else 1
+    if method == 'write_multiple_registers':
+        return len(args[1])
+    return 1
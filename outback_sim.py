@@ -0,0 +1,347 @@
+#!/usr/bin/python
+"""
+Local SunSpec/OutBack Modbus TCP simulator for outback-inverter.
+Synthesizes the register space of an AXS Port from SUNSPEC_DEVICE_MAP so
+discovery, polling and writes can be exercised without real hardware.
+
+    python outback_sim.py --fx 3 --fndc --key 4660 --latency 0.005 --port 5020
+"""
+
+import argparse
+import random
+import socket
+import struct
+import threading
+import time
+from outback_defs import *
+
+try:
+    import queue
+    import socketserver
+except ImportError:
+    import Queue as queue
+    import SocketServer as socketserver
+
+# The AXS Port places the encryption key at register 40076, which puts the
+# OutBack gateway model right after a 67 register common model.
+SIM_COMMON_LENGTH = 67
+SIM_SERIAL = 'SIM0000000001'
+
+
+def modelSize(did):
+    """
+    Number of registers covered by a model, DID and length header included.
+
+    :param did: SunSpec model ID
+    """
+    fields = SUNSPEC_DEVICE_MAP[did]
+    return max(f[0] + f[1] - 1 for f in fields)
+
+
+class SimulatedGateway(object):
+    """
+    Register space of a simulated AXS Port.
+
+    :param inverters: Number of inverters in the stack
+    :param kind: 'FX' or 'GS'
+    :param fndc: True to add a FLEXnet-DC battery monitor
+    :param phase: SunSpec inverter model to add (101, 102 or 103), None for the one that matches the
+                  inverters (101 for FX, 102 for the GS split models), 0 for none
+    :param key: Encryption key, None for an unencrypted gateway
+    :param serial: AXS Port serial number
+    :param seed: Random seed for the synthesized values
+    """
+    def __init__(self, inverters=1, kind='FX', fndc=False, phase=None, key=None,
+                 serial=SIM_SERIAL, seed=0):
+        self.key = key
+        self.random = random.Random(seed)
+        self.registers = {}
+        self.fields = {}
+        self.models = []
+        self.lock = threading.Lock()
+        self.reads = 0
+        self.writes = 0
+        self.registers[ADDR_START] = 0x5375
+        self.registers[ADDR_START + 1] = 0x6E53
+        addr = ADDR_START + 2
+        addr = self.addModel(1, addr, ADDR_START, length=SIM_COMMON_LENGTH, serial=serial)
+        addr = self.addModel(SUNSPEC_OUTBACK_DID, addr)
+        addr = self.addModel(SUNSPEC_OUTBACK_SYS_CONTROL_DID, addr)
+        if kind == 'FX':
+            models = [SUNSPEC_OUTBACK_FX_DID, SUNSPEC_OUTBACK_FX_CONFIG_DID]
+        else:
+            models = [SUNSPEC_OUTBACK_GS_SPLIT_DID, SUNSPEC_OUTBACK_GS_CONFIG_DID]
+        for port in range(1, inverters + 1):
+            mode = 0 if port == 1 else 1
+            for did in models:
+                addr = self.addModel(did, addr, port=port, mode=mode)
+        if fndc:
+            port = inverters + 1
+            addr = self.addModel(SUNSPEC_OUTBACK_FNDC_DID, addr, port=port)
+            addr = self.addModel(SUNSPEC_OUTBACK_FNDC_CONFIG_DID, addr, port=port)
+        if phase is None:
+            phase = SUNSPEC_INVERTER_SINGLE_DID if kind == 'FX' else SUNSPEC_INVERTER_SPLIT_DID
+        if phase:
+            addr = self.addModel(phase, addr)
+        self.registers[addr] = SUNSPEC_END_BLOCK_DID
+        self.registers[addr + 1] = 0
+        self.end = addr + 2
+        if key is not None:
+            self.registers[40076] = key
+
+    def addModel(self, did, addr, base=None, length=None, port=0, mode=0, serial=SIM_SERIAL):
+        """
+        Lay out one model at addr and return the address of the next model.
+
+        :param did: SunSpec model ID
+        :param addr: Address of the model's DID register
+        :param base: Address field offsets are counted from (default: addr)
+        :param length: Value of the model's length register (default: from SUNSPEC_DEVICE_MAP)
+        :param port: AXS Port number of the device
+        :param mode: Stacking mode of the device (0 for the master)
+        :param serial: Serial number for the common model
+        """
+        layout = SUNSPEC_DEVICE_MAP[101 if did in (102, 103) else did]
+        if base is None:
+            base = addr
+        if length is None:
+            length = modelSize(did if did not in (102, 103) else 101) - 2
+        for field in layout:
+            address = base + field[0] - 1
+            name = field[7]
+            self.fields[address] = field
+            if name.endswith('_DID'):
+                words = [did]
+            elif name.endswith('_Length'):
+                words = [length]
+            elif name.endswith('_Port_Number'):
+                words = [port]
+            elif name.endswith('_Stacking_Mode'):
+                words = [mode]
+            elif name == 'C_SerialNumber':
+                words = self.encodeString(serial, field[1])
+            elif name == 'C_SunSpec_ID':
+                continue
+            else:
+                words = self.synthesize(field)
+            for i, word in enumerate(words):
+                self.registers[address + i] = word & 0xFFFF
+        self.models.append((did, addr, length))
+        return addr + length + 2
+
+    def encodeString(self, text, size):
+        """
+        Registers of a NUL padded string field.
+        """
+        data = (text.encode('ascii') + b'\0' * (size * 2))[:size * 2]
+        return list(struct.unpack('>%iH' % size, data))
+
+    def synthesize(self, field):
+        """
+        Plausible raw value(s) for a field based on its type and unit.
+        """
+        size, regtype, unit, name = field[1], field[2], field[3], field[7]
+        r = self.random
+        if regtype == 'string':
+            return self.encodeString(name.split('_')[-1], size)
+        if regtype == 'ipaddress':
+            return [0x0A01, 0x0103][:size]
+        if regtype in ('int32', 'hex8'):
+            return [r.randint(1, 0x7FFF), 0][:size]
+        if name.endswith('_SF') or regtype == 'uhex4':
+            return [0xFFFF]
+        if unit == 'VOLTS_U':
+            return [r.randint(1150, 1250) if regtype in ('float', 'float2') else r.randint(115, 125)]
+        if unit == 'AMPS_U' or name.endswith('_Current'):
+            return [r.randint(0, 400)]
+        if unit in ('KW_U', 'KWH_U', 'WATTS_U', 'VA_U', 'VAR_U'):
+            return [r.randint(0, 60)]
+        if unit == 'PERCENTAGE_U':
+            return [r.randint(20, 100)]
+        if unit == 'ENUMERATED_U':
+            return [r.randint(0, 1)]
+        return [r.randint(0, 100)]
+
+    def jitter(self, address):
+        """
+        Nudge live telemetry so consecutive polls see changing values.
+        """
+        field = self.fields.get(address)
+        if field is None or field[5] or field[1] != 1 or field[7].endswith(('_SF', '_DID', '_Length', '_Number', '_Mode')):
+            return
+        if field[2] in ('float', 'float2', 'int16') and field[3] not in ('ENUMERATED_U', 'NI_U', 'BITFIELD_U'):
+            value = self.registers.get(address, 0)
+            self.registers[address] = max(0, min(0x7FFF, value + self.random.randint(-3, 3)))
+
+    def read(self, address, count, jitter=False):
+        """
+        Raw register words as the AXS Port returns them (encrypted if a key is set).
+        """
+        with self.lock:
+            self.reads += 1
+            words = []
+            for a in range(address, address + count):
+                if jitter:
+                    self.jitter(a)
+                word = self.registers.get(a, 0)
+                if self.key is not None and a not in (ADDR_START, 40076):
+                    word = ENCRYPT(self.key, word)
+                words.append(word)
+            return words
+
+    def write(self, address, values):
+        """
+        Store written words, decrypting them first on an encrypted gateway.
+        """
+        with self.lock:
+            self.writes += 1
+            for i, word in enumerate(values):
+                if self.key is not None:
+                    word = DECRYPT(self.key, word)
+                self.registers[address + i] = word
+
+
+class ModbusHandler(socketserver.BaseRequestHandler):
+    """
+    Serves Modbus TCP function codes 3, 6 and 16 from the simulated gateway.
+    """
+    def recvAll(self, size):
+        data = b''
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def handle(self):
+        server = self.server
+        # Replies go out from a second thread after the configured latency, so the
+        # delay behaves like network round trip time rather than a busy gateway.
+        self.outbox = queue.Queue()
+        sender = threading.Thread(target=self.sendReplies)
+        sender.daemon = True
+        sender.start()
+        try:
+            while True:
+                header = self.recvAll(7)
+                if header is None:
+                    return
+                tid, pid, length, unit = struct.unpack('>HHHB', header)
+                pdu = self.recvAll(length - 1)
+                if pdu is None:
+                    return
+                if not server.pipelining and not self.outbox.empty():
+                    # A gateway that does not pipeline drops the connection when a
+                    # second request arrives before the first was answered.
+                    return
+                if server.error_rate and server.random.random() < server.error_rate:
+                    if server.random.random() < 0.5:
+                        return
+                    self.reply(tid, unit, struct.pack('>BB', ord(pdu[0:1]) | 0x80, 4))
+                    continue
+                self.reply(tid, unit, self.respond(pdu))
+        finally:
+            self.outbox.put(None)
+            sender.join()
+
+    def sendReplies(self):
+        while True:
+            item = self.outbox.get()
+            if item is None:
+                return
+            due, data = item
+            delay = due - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                self.request.sendall(data)
+            except socket.error:
+                return
+            finally:
+                self.outbox.task_done()
+
+    def respond(self, pdu):
+        gateway = self.server.gateway
+        function = ord(pdu[0:1])
+        if function == 3:
+            address, count = struct.unpack('>HH', pdu[1:5])
+            if not 1 <= count <= MAX_READ_REGISTERS:
+                return struct.pack('>BB', 0x83, 3)
+            words = gateway.read(address, count, self.server.jitter)
+            return struct.pack('>BB%iH' % count, 3, count * 2, *words)
+        if function == 6:
+            address, value = struct.unpack('>HH', pdu[1:5])
+            gateway.write(address, [value])
+            return pdu[:5]
+        if function == 16:
+            address, count, size = struct.unpack('>HHB', pdu[1:6])
+            values = struct.unpack('>%iH' % count, pdu[6:6 + size])
+            gateway.write(address, values)
+            return struct.pack('>BHH', 16, address, count)
+        return struct.pack('>BB', function | 0x80, 1)
+
+    def reply(self, tid, unit, pdu):
+        data = struct.pack('>HHHB', tid, 0, len(pdu) + 1, unit) + pdu
+        self.outbox.put((time.time() + self.server.latency, data))
+
+
+class SimulatorServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    """
+    Threaded Modbus TCP server around a SimulatedGateway.
+
+    :param gateway: The SimulatedGateway to serve
+    :param address: (host, port) to listen on, port 0 picks a free port
+    :param latency: Seconds of delay added to every request
+    :param error_rate: Fraction of requests answered with an exception or a dropped connection
+    :param pipelining: False to drop connections that send requests back to back
+    :param jitter: True to vary live telemetry between reads
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, gateway, address=('127.0.0.1', 0), latency=0.0, error_rate=0.0,
+                 pipelining=True, jitter=False):
+        socketserver.TCPServer.__init__(self, address, ModbusHandler)
+        self.gateway = gateway
+        self.latency = latency
+        self.error_rate = error_rate
+        self.pipelining = pipelining
+        self.jitter = jitter
+        self.random = random.Random(1)
+
+    def start(self):
+        """
+        Serve from a background thread and return (host, port).
+        """
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self.server_address
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulated OutBack AXS Port (SunSpec Modbus TCP)')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=5020)
+    parser.add_argument('--fx', type=int, default=0, help='Number of FX inverters')
+    parser.add_argument('--gs', type=int, default=0, help='Number of GS inverters')
+    parser.add_argument('--fndc', action='store_true', help='Add a FLEXnet-DC')
+    parser.add_argument('--phase', type=int, default=None,
+                        help='SunSpec inverter model (default: 101 for FX, 102 for GS, 0 for none)')
+    parser.add_argument('--key', type=int, default=None, help='Encryption key')
+    parser.add_argument('--serial', default=SIM_SERIAL, help='AXS Port serial number')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--no-pipeline', action='store_true')
+    parser.add_argument('--jitter', action='store_true')
+    args = parser.parse_args()
+    kind, count = ('GS', args.gs) if args.gs else ('FX', args.fx or 1)
+    gateway = SimulatedGateway(count, kind, args.fndc, args.phase, args.key, args.serial)
+    server = SimulatorServer(gateway, (args.host, args.port), args.latency, args.error_rate,
+                             not args.no_pipeline, args.jitter)
+    print('Simulated %i %s inverter AXS Port on %s:%i' % (count, kind, args.host, args.port))
+    server.serve_forever()
+
+if __name__ == '__main__':
+    main()
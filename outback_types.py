@@ -4,20 +4,35 @@ This library consists of four classes and one function to assist with node
 
 from polyglot.nodeserver_api import Node
 import sys
+import os
 import time
 import struct
+import json
 from outback_defs import *
-from pyModbusTCP.client import ModbusClient
+from outback_session import ModbusSession
+from outback_decode import NOT_IMPLEMENTED, SCALE_FACTORS, decodeRegister, encodeValue, getDecoder
+from outback_writes import WriteQueue
 
 # 1 for Normal/Info 2 for Debug
 DEBUGLEVEL = '2'
 
+# The port (and stacking mode) registers read for each model during discovery
+DEVICE_PORT_REGISTERS = {
+    64113: ('FX_Port_Number', None),
+    64114: ('FXconfig_Port_Number', 'FXconfig_Stacking_Mode'),
+    64115: ('GS_Split_Port_Number', None),
+    64116: ('GSconfig_Port_Number', 'GSconfig_Stacking_Mode'),
+    64117: ('GS_Single_Port_Number', None),
+    64118: ('FN_Port_Number', None),
+    64119: ('FNconfig_Port_Number', None),
+}
+
 class GSInverter(Node):
     """
     Instantiate a GSInverter Type Node.
     
     :param parent: Parent node device (OutbackNodeServer)
-    :param primary: True/False if this is the primary node
+    :param primary: The OutbackNode of the AXS Port this device is on
     :param address: Address of the node for ISY
     :param device: The device value we discovered from the AXS Port
     :param manifest: Directory of config values
@@ -45,7 +60,12 @@ class GSInverter(Node):
         self.device = device
         self.name = name
         self.registers = {}
-        self.controller = self.parent.controller
+        self.polls = 0
+        self.config_due = True
+        self.sent = {}
+        self.updates_sent = 0
+        self.updates_suppressed = 0
+        self.controller = primary
         self.logger.info('Getting GS Inverter Registers')
         super(GSInverter, self).__init__(parent, address, self.name, primary, manifest)
         if not self.getRegisters(self.device):
@@ -57,16 +77,14 @@ class GSInverter(Node):
         
         :param device: The device to pull from
         """
+        values = getMany(self.logger, self.controller.session, registersDue(self), device.port)
         for i, register in enumerate(self.registers_needed):
-            devtype = getRegisterDevType(register)
-            for dev in DEVICES:
-                if dev.type == devtype:
-                        if device.port == dev.port:
-                            self.registers[register] = getOne(self.logger, dev, register)
+            if register not in values: continue
+            self.registers[register] = values[register]
             driver = 'GV' + str(i+1)
             if self.registers[register] is not None:
-                if self.registers[register] == 'Not Implemented': self.registers[register] = 0
-                self.set_driver(driver, self.registers[register])
+                if self.registers[register] is NOT_IMPLEMENTED: self.registers[register] = 0
+                setDriver(self, driver, self.registers[register])
         if DEBUGLEVEL == '2':
             self.logger.debug('%s', self.registers)
         return True
@@ -79,43 +97,35 @@ class GSInverter(Node):
         """
         self.logger.info('kwargs: %s', kwargs)
         register = kwargs.get('cmd')
-        regtype = getRegisterDevType(register)
+        regtype = getRegisterDevType(register, self.controller.session.phase)
         value = kwargs.get('value')
         val = int()
         uom = kwargs.get('uom')
         self.logger.info('setRegister: %s(%i) UOM: %s = %s', register, regtype, uom, value)
         if (self.controller.openConnection()):  
-            for dev in DEVICES:
+            for dev in self.controller.session.devices:
                 if dev.type == regtype:
                     if uom == 25: val = int(value)
                     elif uom == 30: val = int(value * 10)
                     elif uom in [1, 72]: val = float(value * 10)
                     else: val = value
-                    self.logger.info('Attempting setOne')
-                    if setOne(self.logger, dev, register, val):
-                        try:
-                            self.set_driver('GV' + str((self.registers_needed.index(register) + 1)), value)
-                        except ValueError as e:
-                            self.logger.info('No ST field for the register: %s', register)
-        self.controller.closeConnection()
+                    self.logger.info('Queueing write')
+                    self.controller.writes.put(dev, register, val, writeDone(self, register, value))
         return True
 
     def update_info(self):
         """
         Update all the registers (runs on long_poll)
         """
-        time.sleep(1)
-        if (self.parent.controller.openConnection()):  
+        if (self.controller.openConnection()):  
             self.getRegisters(self.device)
-        self.parent.controller.closeConnection()
         return
 
     def query(self, **kwargs):
         """
-        Get updated values for the registers
+        Get updated values for the registers, reported from a background refresh
         """
-        self.update_info()
-        self.report_driver()
+        self.parent.query([self], 0)
         return True
 
     _drivers = {
@@ -144,7 +154,7 @@ class GSSingleInverter(Node):
     Instantiate a GS Single Phase Inverter Type Node.
     
     :param parent: Parent node device (OutbackNodeServer)
-    :param primary: True/False if this is the primary node
+    :param primary: The OutbackNode of the AXS Port this device is on
     :param address: Address of the node for ISY
     :param device: The device value we discovered from the AXS Port
     :param manifest: Directory of config values
@@ -171,7 +181,12 @@ class GSSingleInverter(Node):
         self.device = device
         self.name = name
         self.registers = {}
-        self.controller = self.parent.controller
+        self.polls = 0
+        self.config_due = True
+        self.sent = {}
+        self.updates_sent = 0
+        self.updates_suppressed = 0
+        self.controller = primary
         self.logger.info('Getting GS Single Registers')
         super(GSSingleInverter, self).__init__(parent, address, self.name, primary, manifest)
         if not self.getRegisters(self.device):
@@ -183,16 +198,14 @@ class GSSingleInverter(Node):
         
         :param device: The device to pull from
         """
+        values = getMany(self.logger, self.controller.session, registersDue(self), device.port)
         for i, register in enumerate(self.registers_needed):
-            devtype = getRegisterDevType(register)
-            for dev in DEVICES:
-                if dev.type == devtype:
-                        if device.port == dev.port:
-                            self.registers[register] = getOne(self.logger, dev, register)
+            if register not in values: continue
+            self.registers[register] = values[register]
             driver = 'GV' + str(i+1)
             if self.registers[register] is not None:
-                if self.registers[register] == 'Not Implemented': self.registers[register] = 0
-                self.set_driver(driver, self.registers[register])
+                if self.registers[register] is NOT_IMPLEMENTED: self.registers[register] = 0
+                setDriver(self, driver, self.registers[register])
         if DEBUGLEVEL == '2':
             self.logger.debug('%s', self.registers)
         return True
@@ -205,43 +218,35 @@ class GSSingleInverter(Node):
         """
         self.logger.info('kwargs: %s', kwargs)
         register = kwargs.get('cmd')
-        regtype = getRegisterDevType(register)
+        regtype = getRegisterDevType(register, self.controller.session.phase)
         value = kwargs.get('value')
         val = int()
         uom = kwargs.get('uom')
         self.logger.info('setRegister: %s(%i) UOM: %s = %s', register, regtype, uom, value)
         if (self.controller.openConnection()):  
-            for dev in DEVICES:
+            for dev in self.controller.session.devices:
                 if dev.type == regtype:
                     if uom == 25: val = int(value)
                     elif uom == 30: val = int(value * 10)
                     elif uom in [1, 72]: val = float(value * 10)
                     else: val = value
-                    self.logger.info('Attempting setOne')
-                    if setOne(self.logger, dev, register, val):
-                        try:
-                            self.set_driver('GV' + str((self.registers_needed.index(register) + 1)), value)
-                        except ValueError as e:
-                            self.logger.info('No ST field for the register: %s', register)
-        self.controller.closeConnection()
+                    self.logger.info('Queueing write')
+                    self.controller.writes.put(dev, register, val, writeDone(self, register, value))
         return True
 
     def update_info(self):
         """
         Update all the registers (runs on long_poll)
         """
-        time.sleep(1)
-        if (self.parent.controller.openConnection()):  
+        if (self.controller.openConnection()):  
             self.getRegisters(self.device)
-        self.parent.controller.closeConnection()
         return
 
     def query(self, **kwargs):
         """
-        Get updated values for the registers
+        Get updated values for the registers, reported from a background refresh
         """
-        self.update_info()
-        self.report_driver()
+        self.parent.query([self], 0)
         return True
 
     _drivers = {
@@ -268,7 +273,7 @@ class SunSpecInverter(Node):
     Instantiate a SunSpec Type Node.
     
     :param parent: Parent node device (OutbackNodeServer)
-    :param primary: True/False if this is the primary node
+    :param primary: The OutbackNode of the AXS Port this device is on
     :param address: Address of the node for ISY
     :param device: The device value we discovered from the AXS Port
     :param manifest: Directory of config values
@@ -290,7 +295,12 @@ class SunSpecInverter(Node):
         self.device = device
         self.name = name
         self.registers = {}
-        self.controller = self.parent.controller
+        self.polls = 0
+        self.config_due = True
+        self.sent = {}
+        self.updates_sent = 0
+        self.updates_suppressed = 0
+        self.controller = primary
         self.logger.info('Getting SunSpec Inverter Registers')
         super(SunSpecInverter, self).__init__(parent, address, self.name, primary, manifest)
         if not self.getRegisters(self.device):
@@ -302,16 +312,14 @@ class SunSpecInverter(Node):
         
         :param device: The device to pull from
         """
+        values = getMany(self.logger, self.controller.session, registersDue(self), device.port)
         for i, register in enumerate(self.registers_needed):
-            devtype = getRegisterDevType(register)
-            for dev in DEVICES:
-                if dev.type == devtype:
-                        if device.port == dev.port:
-                            self.registers[register] = getOne(self.logger, dev, register)
+            if register not in values: continue
+            self.registers[register] = values[register]
             driver = 'GV' + str(i+1)
             if self.registers[register] is not None:
-                if self.registers[register] == 'Not Implemented': self.registers[register] = 0
-                self.set_driver(driver, self.registers[register])
+                if self.registers[register] is NOT_IMPLEMENTED: self.registers[register] = 0
+                setDriver(self, driver, self.registers[register])
         if DEBUGLEVEL == '2':
             self.logger.debug('%s', self.registers)
         return True
@@ -324,43 +332,35 @@ class SunSpecInverter(Node):
         """
         self.logger.info('kwargs: %s', kwargs)
         register = kwargs.get('cmd')
-        regtype = getRegisterDevType(register)
+        regtype = getRegisterDevType(register, self.controller.session.phase)
         value = kwargs.get('value')
         val = int()
         uom = kwargs.get('uom')
         self.logger.info('setRegister: %s(%i) UOM: %s = %s', register, regtype, uom, value)
         if (self.controller.openConnection()):  
-            for dev in DEVICES:
+            for dev in self.controller.session.devices:
                 if dev.type == regtype:
                     if uom == 25: val = int(value)
                     elif uom == 30: val = int(value * 10)
                     elif uom in [1, 72]: val = float(value * 10)
                     else: val = value
-                    self.logger.info('Attempting setOne')
-                    if setOne(self.logger, dev, register, val):
-                        try:
-                            self.set_driver('GV' + str((self.registers_needed.index(register) + 1)), value)
-                        except ValueError as e:
-                            self.logger.info('No ST field for the register: %s', register)
-        self.controller.closeConnection()
+                    self.logger.info('Queueing write')
+                    self.controller.writes.put(dev, register, val, writeDone(self, register, value))
         return True
 
     def update_info(self):
         """
         Update all the registers (runs on long_poll)
         """
-        time.sleep(1)
-        if (self.parent.controller.openConnection()):  
+        if (self.controller.openConnection()):  
             self.getRegisters(self.device)
-        self.parent.controller.closeConnection()
         return
 
     def query(self, **kwargs):
         """
-        Get updated values for the registers
+        Get updated values for the registers, reported from a background refresh
         """
-        self.update_info()
-        self.report_driver()
+        self.parent.query([self], 0)
         return True
 
     _drivers = {
@@ -376,7 +376,7 @@ class FLEXNet(Node):
     Instantiate a FLEXNet-DC Add-on Module Type Node.
     
     :param parent: Parent node device (OutbackNodeServer)
-    :param primary: True/False if this is the primary node
+    :param primary: The OutbackNode of the AXS Port this device is on
     :param address: Address of the node for ISY
     :param device: The device value we discovered from the AXS Port
     :param manifest: Directory of config values
@@ -400,7 +400,12 @@ class FLEXNet(Node):
         self.device = device
         self.name = name
         self.registers = {}
-        self.controller = self.parent.controller
+        self.polls = 0
+        self.config_due = True
+        self.sent = {}
+        self.updates_sent = 0
+        self.updates_suppressed = 0
+        self.controller = primary
         self.logger.info('Getting FLEXnet-DC Registers')
         super(FLEXNet, self).__init__(parent, address, self.name, primary, manifest)
         if not self.getRegisters(self.device):
@@ -412,16 +417,14 @@ class FLEXNet(Node):
         
         :param device: The device to pull from
         """
+        values = getMany(self.logger, self.controller.session, registersDue(self), device.port)
         for i, register in enumerate(self.registers_needed):
-            devtype = getRegisterDevType(register)
-            for dev in DEVICES:
-                if dev.type == devtype:
-                        if device.port == dev.port:
-                            self.registers[register] = getOne(self.logger, dev, register)
+            if register not in values: continue
+            self.registers[register] = values[register]
             driver = 'GV' + str(i+1)
             if self.registers[register] is not None:
-                if self.registers[register] == 'Not Implemented': self.registers[register] = 0
-                self.set_driver(driver, self.registers[register])
+                if self.registers[register] is NOT_IMPLEMENTED: self.registers[register] = 0
+                setDriver(self, driver, self.registers[register])
         if DEBUGLEVEL == '2':
             self.logger.debug('%s', self.registers)
 
@@ -435,50 +438,42 @@ class FLEXNet(Node):
         """
         self.logger.info('kwargs: %s', kwargs)
         register = kwargs.get('cmd')
-        regtype = getRegisterDevType(register)
+        regtype = getRegisterDevType(register, self.controller.session.phase)
         value = kwargs.get('value')
         val = int()
         uom = kwargs.get('uom')
         self.logger.info('setRegister: %s(%i) UOM: %s = %s', register, regtype, uom, value)
         if (self.controller.openConnection()):  
-            for dev in DEVICES:
+            for dev in self.controller.session.devices:
                 if dev.type == regtype:
                     if uom == 25: val = int(value)
                     elif uom == 30: val = int(value * 10)
                     elif uom in [1, 72]: val = float(value * 10)
                     else: val = value
-                    self.logger.info('Attempting setOne')
-                    if setOne(self.logger, dev, register, val):
-                        try:
-                            self.set_driver('GV' + str((self.registers_needed.index(register) + 1)), value)
-                        except ValueError as e:
-                            self.logger.info('No ST field for the register: %s', register)
-        self.controller.closeConnection()
+                    self.logger.info('Queueing write')
+                    self.controller.writes.put(dev, register, val, writeDone(self, register, value))
         return True
 
     def update_info(self):
         """
         Update all the registers (runs on long_poll)
         """
-        time.sleep(1)
-        if (self.parent.controller.openConnection()):  
+        if (self.controller.openConnection()):  
             self.getRegisters(self.device)
-        self.parent.controller.closeConnection()
         return
 
     def query(self, **kwargs):
         """
-        Get updated values for the registers
+        Get updated values for the registers, reported from a background refresh
         """
-        self.update_info()
-        self.report_driver()
+        self.parent.query([self], 0)
         return True
 
     _drivers = {
                 'GV1': [0, 1, float], 'GV2': [0, 1, float],
                 'GV3': [0, 1, float], 'GV4': [0, 30, float],
-                'GV3': [0, 30, float], 'GV4': [0, 30, float],
-                'GV3': [0, 51, int]}
+                'GV5': [0, 30, float], 'GV6': [0, 30, float],
+                'GV7': [0, 51, int]}
 
     _commands = {'QUERY': query}
    
@@ -489,7 +484,7 @@ class FXInverter(Node):
     Instantiate a FX Model Type Node.
     
     :param parent: Parent node device (OutbackNodeServer)
-    :param primary: True/False if this is the primary node
+    :param primary: The OutbackNode of the AXS Port this device is on
     :param address: Address of the node for ISY
     :param device: The device value we discovered from the AXS Port
     :param manifest: Directory of config values
@@ -515,7 +510,12 @@ class FXInverter(Node):
         self.device = device
         self.name = name
         self.registers = {}
-        self.controller = self.parent.controller
+        self.polls = 0
+        self.config_due = True
+        self.sent = {}
+        self.updates_sent = 0
+        self.updates_suppressed = 0
+        self.controller = primary
         self.logger.info('Getting FX Registers')
         super(FXInverter, self).__init__(parent, address, self.name, primary, manifest)
         if not self.getRegisters(self.device):
@@ -527,16 +527,14 @@ class FXInverter(Node):
         
         :param device: The device to pull from
         """
+        values = getMany(self.logger, self.controller.session, registersDue(self), device.port)
         for i, register in enumerate(self.registers_needed):
-            devtype = getRegisterDevType(register)
-            for dev in DEVICES:
-                if dev.type == devtype:
-                        if device.port == dev.port:
-                            self.registers[register] = getOne(self.logger, dev, register)
+            if register not in values: continue
+            self.registers[register] = values[register]
             driver = 'GV' + str(i+1)
             if self.registers[register] is not None:
-                if self.registers[register] == 'Not Implemented': self.registers[register] = 0
-                self.set_driver(driver, self.registers[register])
+                if self.registers[register] is NOT_IMPLEMENTED: self.registers[register] = 0
+                setDriver(self, driver, self.registers[register])
         if DEBUGLEVEL == '2':
             self.logger.debug('%s', self.registers)
         return True
@@ -549,43 +547,35 @@ class FXInverter(Node):
         """
         self.logger.info('kwargs: %s', kwargs)
         register = kwargs.get('cmd')
-        regtype = getRegisterDevType(register)
+        regtype = getRegisterDevType(register, self.controller.session.phase)
         value = kwargs.get('value')
         val = int()
         uom = kwargs.get('uom')
         self.logger.info('setRegister: %s(%i) UOM: %s = %s', register, regtype, uom, value)
         if (self.controller.openConnection()):  
-            for dev in DEVICES:
+            for dev in self.controller.session.devices:
                 if dev.type == regtype:
                     if uom == 25: val = int(value)
                     elif uom == 30: val = int(value * 10)
                     elif uom in [1, 72]: val = float(value * 10)
                     else: val = value
-                    self.logger.info('Attempting setOne')
-                    if setOne(self.logger, dev, register, val):
-                        try:
-                            self.set_driver('GV' + str((self.registers_needed.index(register) + 1)), value)
-                        except ValueError as e:
-                            self.logger.info('No ST field for the register: %s', register)
-        self.controller.closeConnection()
+                    self.logger.info('Queueing write')
+                    self.controller.writes.put(dev, register, val, writeDone(self, register, value))
         return True
 
     def update_info(self):
         """
         Update all the registers (runs on long_poll)
         """
-        time.sleep(1)
-        if (self.parent.controller.openConnection()):  
+        if (self.controller.openConnection()):  
             self.getRegisters(self.device)
-        self.parent.controller.closeConnection()
         return
 
     def query(self, **kwargs):
         """
-        Get updated values for the registers
+        Get updated values for the registers, reported from a background refresh
         """
-        self.update_info()
-        self.report_driver()
+        self.parent.query([self], 0)
         return True
 
     _drivers = {
@@ -609,13 +599,17 @@ class FXInverter(Node):
 
 class OutbackNode(Node):
     """
-    Instantiate the Main OutBack Type Node.
+    Instantiate the Main OutBack Type Node. There is one per AXS Port, it owns the ModbusSession
+    (with the discovered devices) of that AXS Port and the nodes of its inverters.
     
     :param parent: Parent node device (OutbackNodeServer)
+    :param address: Address of the node for ISY (replaced by the AXS Port serial number)
+    :param name: Name of the node (replaced by the deployment type)
     :param primary: True/False if this is the primary node
-    :param address: Address of the node for ISY
-    :param device: The device value we discovered from the AXS Port
     :param manifest: Directory of config values
+    :param host: IP Address of the AXS Port
+    :param port: Modbus TCP port of the AXS Port
+    :param prefix: Prefix for the addresses of the inverter nodes, '' for the first AXS Port
     
     .. autoattribute:: _drivers
     .. autoattribute:: _commands
@@ -627,20 +621,32 @@ class OutbackNode(Node):
                                     'OB_Set_Inverter_Charger_Current_Limit', 'OB_Set_Inverter_AC1_Current_Limit',
                                     'OB_Set_Inverter_AC2_Current_Limit'
                                     ]
-    master = None
-    slaves = []
 
-    def __init__(self, parent, address, name, primary, manifest=None):
+    def __init__(self, parent, address, name, primary, manifest=None, host=DEVICEIP, port=DEVICEPORT, prefix=''):
         self.parent = parent
         self.address = address
         self.serial = None
+        self.prefix = prefix
+        self.ready = False
+        self.inverter_master = None
+        self.inverter_slaves = []
+        self.sunspec = None
+        self.flexnet = None
         self.registers = {}
         self.uom = {}
+        self.polls = 0
+        self.config_due = True
+        self.sent = {}
+        self.updates_sent = 0
+        self.updates_suppressed = 0
         # Define the local logger for ease of calling
         self.logger = self.parent.poly.logger
+        self.session = ModbusSession(self.logger, host, port)
+        self.writes = WriteQueue(self.logger, setMany)
         if (self.openConnection()):        
-            # Get a list of all the devices attached to the deployment
-            self.getDevices()
+            # Get a list of all the devices attached to the deployment, the cached list if it is still valid
+            if not self.loadDevices() and self.getDevices():
+                self.saveDevices()
             # Determine what kind of setup this is. FX/GS, What phase type? FLEXnet-DC?
             self.determineSetup()
             # Retrieves the AXS Port Serial number for unique device name in ISY.
@@ -648,15 +654,16 @@ class OutbackNode(Node):
             if self.serial:
                 self.address = self.serial
             # If we didn't find a valid deployment type, return and do nothing after reporting error.
-            if DEPLOYMENTTYPE == None:
+            if self.session.type == None:
                 self.logger.error('Invalid Deployment Type, No FX or GS deployments found.')
-                C.close()
+                self.session.close()
                 return
             else:
                 # Set the name string of the ISY Main Node to 'Outback FX/GS Single/Split/Three Phase'
-                self.name = 'OutBack ' + str(DEPLOYMENTTYPE) + ' ' + str(DEPLOYMENTPHASE) + ' Phase'
+                self.name = 'OutBack ' + str(self.session.type) + ' ' + str(self.session.phase) + ' Phase'
             # Create OutBack System Controller Node in ISY
             super(OutbackNode, self).__init__(parent, self.address, self.name, primary, manifest)
+            self.ready = True
             if not self.getRegisters():
                 self.logger.error('Failed to get registers for %s', self.name)
 
@@ -665,16 +672,15 @@ class OutbackNode(Node):
         getRegisters for the device based on the registers_needed
         
         """
+        values = getMany(self.logger, self.session, registersDue(self))
         for i, register in enumerate(self.registers_needed):
-            devtype = getRegisterDevType(register)
-            for dev in DEVICES:
-                if dev.type == devtype:
-                        self.registers[register] = getOne(self.logger, dev, register)
+            if register not in values: continue
+            self.registers[register] = values[register]
             driver = 'GV' + str(i+1)
             try:
                 if self.registers[register] is not None:
-                    if self.registers[register] == 'Not Implemented': self.registers[register] = 0
-                    self.set_driver(driver, myfloat(self.registers[register]))
+                    if self.registers[register] is NOT_IMPLEMENTED: self.registers[register] = 0
+                    setDriver(self, driver, myfloat(self.registers[register]))
             except KeyError as e:
                 self.logger.error('KeyError in getRegisters: %s', e)
         if DEBUGLEVEL == '2':
@@ -683,11 +689,28 @@ class OutbackNode(Node):
 
     def getSerial(self):
         """
-        Gets the Serial number of the AXS Port (Used for address creation)
+        Gets the Serial number of the AXS Port (Used for address creation), without its NUL padding.
+        Returns None if it can't be read.
         """
-        for device in DEVICES:
+        for device in self.session.devices:
             if device.type == 1:
-                return str(getOne(self.logger, device, 'C_SerialNumber'))[:14].lower()
+                serial = getOne(self.logger, device, 'C_SerialNumber')
+                if serial is None or serial is NOT_IMPLEMENTED: return None
+                return str(serial).strip('\x00 ')[:NODE_ADDRESS_LENGTH].lower() or None
+
+    def nodes(self):
+        """
+        This node and the nodes of all the devices on its AXS Port
+        """
+        nodes = [self]
+        if self.inverter_master is not None:
+            nodes.append(self.inverter_master)
+        nodes.extend(self.inverter_slaves)
+        if self.sunspec is not None:
+            nodes.append(self.sunspec)
+        if self.flexnet is not None:
+            nodes.append(self.flexnet)
+        return nodes
 
     def addInverters(self, controller):
         """
@@ -698,71 +721,84 @@ class OutbackNode(Node):
         address = '' 
         name = ''
         manifest = self.parent.config.get('manifest', {})
-        if DEPLOYMENTTYPE in ['FX', 'GS']:
-            for device in DEVICES:
+        deploymenttype = self.session.type
+        if deploymenttype in ['FX', 'GS']:
+            for device in self.session.devices:
                 if device.type == 64114:
                     self.logger.info('Stacking Mode: %i port %i', device.mode, device.port)
-                    address = (DEPLOYMENTTYPE + '_inv_' + str(device.mode) + '_' + str(device.port)).lower()
+                    address = self.nodeAddress(deploymenttype + '_inv_' + str(device.mode) + '_' + str(device.port))
+                    if address is None: continue
                     lnode = self.parent.get_node(address)
                     if not lnode:
                         if device.mode in [0,4,10,19]:
                             #self.logger.info('get_node: %s', self.parent.get_node[self.address])
-                            name = DEPLOYMENTTYPE + ' Inverter - Master - Port ' + str(device.port)
-                            self.parent.inverter_master = FXInverter(self.parent, controller, address, device, name, manifest)
+                            name = deploymenttype + ' Inverter - Master - Port ' + str(device.port)
+                            self.inverter_master = FXInverter(self.parent, controller, address, device, name, manifest)
                         else:
-                            name = DEPLOYMENTTYPE + ' Inverter - Slave - Port ' + str(device.port)
-                            self.parent.inverter_slaves.append(FXInverter(self.parent, controller, address, device, name, manifest))
+                            name = deploymenttype + ' Inverter - Slave - Port ' + str(device.port)
+                            self.inverter_slaves.append(FXInverter(self.parent, controller, address, device, name, manifest))
                 elif device.type == 64116:
                     self.logger.info('Stacking Mode: %i port %i', device.mode, device.port)
-                    address = (DEPLOYMENTTYPE + '_inv_' + str(device.mode) + '_' + str(device.port)).lower()
+                    address = self.nodeAddress(deploymenttype + '_inv_' + str(device.mode) + '_' + str(device.port))
+                    if address is None: continue
                     lnode = self.parent.get_node(address)
                     if not lnode:
                         if device.mode in [0,4,10,19]:
                             #self.logger.info('get_node: %s', self.parent.get_node[self.address])
-                            name = DEPLOYMENTTYPE + ' Inverter - Master - Port ' + str(device.port)
-                            if DEPLOYMENTPHASE == 'Single':
-                                self.parent.inverter_master = GSSingleInverter(self.parent, controller, address, device, name, manifest)
+                            name = deploymenttype + ' Inverter - Master - Port ' + str(device.port)
+                            if self.session.phase == 'Single':
+                                self.inverter_master = GSSingleInverter(self.parent, controller, address, device, name, manifest)
                             else:
-                                self.parent.inverter_master = GSInverter(self.parent, controller, address, device, name, manifest)
+                                self.inverter_master = GSInverter(self.parent, controller, address, device, name, manifest)
                         else:
-                            name = DEPLOYMENTTYPE + ' Inverter - Slave - Port ' + str(device.port)
-                            if DEPLOYMENTPHASE == 'Single':
-                                self.parent.inverter_slaves.append(GSSingleInverter(self.parent, controller, address, device, name, manifest))
+                            name = deploymenttype + ' Inverter - Slave - Port ' + str(device.port)
+                            if self.session.phase == 'Single':
+                                self.inverter_slaves.append(GSSingleInverter(self.parent, controller, address, device, name, manifest))
                             else:
-                                self.parent.inverter_slaves.append(GSInverter(self.parent, controller, address, device, name, manifest))
+                                self.inverter_slaves.append(GSInverter(self.parent, controller, address, device, name, manifest))
                 elif device.type == 64119:
-                    address = (DEPLOYMENTTYPE + '_flexnet_' + str(device.port)).lower()
+                    address = self.nodeAddress(deploymenttype + '_flexnet_' + str(device.port))
+                    if address is None: continue
                     lnode = self.parent.get_node(address)
                     name = 'FLEXnet-DC'
                     if not lnode:
-                        self.parent.flexnet = FLEXNet(self.parent, controller, address, device, name, manifest)
+                        self.flexnet = FLEXNet(self.parent, controller, address, device, name, manifest)
                 elif device.type in [101, 102, 103]:
-                    address = ('sunspec_' + str(device.type))
-                    name = str('SunSpec ' + DEPLOYMENTPHASE + ' Phase Inverter')
+                    address = self.nodeAddress('sunspec_' + str(device.type))
+                    if address is None: continue
+                    name = str('SunSpec ' + self.session.phase + ' Phase Inverter')
                     lnode = self.parent.get_node(address)
                     if not lnode:
-                        self.parent.sunspec = SunSpecInverter(self.parent, controller, address, device, name, manifest)
+                        self.sunspec = SunSpecInverter(self.parent, controller, address, device, name, manifest)
                     
+    def nodeAddress(self, name):
+        """
+        The ISY address of a node of this AXS Port: the name with the gateway prefix, in lower case.
+        Returns None (and logs an error) if it is longer than NODE_ADDRESS_LENGTH.
+
+        :param name: The address of the node without the prefix, e.g. 'fx_inv_0_1'
+        """
+        address = (self.prefix + name).lower()
+        if len(address) > NODE_ADDRESS_LENGTH:
+            self.logger.error('Node address %s is longer than %i characters, skipping the node', address, NODE_ADDRESS_LENGTH)
+            return None
+        return address
+
     def update_info(self):
         """
         Update all the registers (runs on long_poll)
         """
-        time.sleep(1)
         if (self.openConnection()):  
             self.getRegisters()
-        self.closeConnection()
         return
 
     def query(self, **kwargs):
         """
-        Get updated values for the registers
+        Get updated values for the registers. The refresh and reports run in the background, so the
+        ISY command thread is free as soon as the query is queued.
         """
         self.logger.info('Query for all registers and report.')
-        self.parent.long_poll()
-        self.parent.report_drivers()
-        # Wait a few seconds and do it again. The ISY has a bad habit of missing some updates
-        time.sleep(10)
-        self.parent.report_drivers()
+        self.parent.query()
         return True
 
     class SunSpecDevice:
@@ -779,6 +815,7 @@ class OutbackNode(Node):
         def __init__(self, parent, id=0, name='', type=0, addr=0, offset=0):
             self.id = id
             self.parent = parent
+            self.session = parent.session
             self.logger = self.parent.logger
             self.name = name
             self.type = type
@@ -786,133 +823,199 @@ class OutbackNode(Node):
             self.offset = offset
             self.mode = None
             self.port = None
+            self.scale_factors = {}
             self.logger.info('Added Device[%i]: %s at register address: %s device type: %s with the offset value of %s', self.id, self.name, self.addr, self.type, self.offset)
 
     def getDevices(self):
         """
         Function to get all the devices that are present in the system. Performs a scan of all the registers.
+        The devices replace the session's once the scan is complete. If any read fails the scan is
+        abandoned and the session keeps its devices. Returns True if the scan completed.
         """
-        global DEPLOYMENTDEVICES
+        devices = []
+        table = self.session.table()
         nb = 2
         addr = ADDR_START
         device, offset = 0, 0
         while True:
             addr += (offset + 2)
-            register = C.read_holding_registers(addr, nb)
-            if ENCRYPTED: 
-                for i in range(len(register)):
-                    register[i] = DECRYPT(ENCRYPTIONKEY, register[i])
-            #except TypeError as e:
-            #register = DECRYPT(ENCRYPTIONKEY, register)
-            DEVICES.insert(device, self.SunSpecDevice(self, device, SUNSPEC_DEVICE_LOOKUP.get(register[0]), register[0], addr, register[1]))
-            DEPLOYMENTDEVICES.append(register[0])
-            if register[0] == 64113:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'FX_Port_Number')
-            elif register[0] == 64114:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'FXconfig_Port_Number')
-                DEVICES[device].mode = getOne(self.logger, DEVICES[device], 'FXconfig_Stacking_Mode')
-            elif register[0] == 64115:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'GS_Split_Port_number')
-            elif register[0] == 64116:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'GSconfig_Port_number')
-                DEVICES[device].mode = getOne(self.logger, DEVICES[device], 'GSconfig_Stacking_Mode')
-            elif register[0] == 64117:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'GS_Single_Port_number')
-            elif register[0] == 64118:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'FN_Port_Number')
-            elif register[0] == 64119:
-                DEVICES[device].port = getOne(self.logger, DEVICES[device], 'FNconfig_Port_Number')
+            register = self.session.read_holding_registers(addr, nb)
+            if register is None:
+                self.logger.error('Device scan failed reading register %i, keeping the previous devices', addr)
+                return False
+            if table is not None:
+                register = [table[r] for r in register]
+            devices.insert(device, self.SunSpecDevice(self, device, SUNSPEC_DEVICE_LOOKUP.get(register[0]), register[0], addr, register[1]))
+            if register[0] in DEVICE_PORT_REGISTERS:
+                port, mode = DEVICE_PORT_REGISTERS[register[0]]
+                devices[device].port = getOne(self.logger, devices[device], port)
+                if mode is not None:
+                    devices[device].mode = getOne(self.logger, devices[device], mode)
+                if devices[device].port is None or (mode is not None and devices[device].mode is None):
+                    self.logger.error('Device scan failed reading the port of model %i, keeping the previous devices', register[0])
+                    return False
             offset = register[1]
-            if ((DEVICES[device].type == 65535) or (DEVICES[device].type == 0)): break
+            if ((devices[device].type == 65535) or (devices[device].type == 0)): break
             device += 1
-        DEVICES[0].addr -= 2
+        devices[0].addr -= 2
+        self.session.setDevices(devices)
         self.logger.info('OutBack: %i devices were added', (device+1))
+        return True
+
+    def cachePath(self):
+        """
+        Full path of the discovery cache file (None if caching is disabled)
+        """
+        if not DISCOVERY_CACHE: return None
+        return os.path.join(os.path.dirname(os.path.abspath(__file__)), DISCOVERY_CACHE)
+
+    def readSerial(self):
+        """
+        Reads the serial number straight from the SunSpec common model, without needing the devices.
+        """
+        field = REGISTER_INDEX['C_SerialNumber'][1]
+        register = self.session.read_holding_registers(ADDR_START + field[0] - 1, field[1])
+        if register is None: return None
+        return decodeRegister('C_SerialNumber', register, self.session.table()).strip('\x00 ')
+
+    def loadDevices(self):
+        """
+        Loads the device list from the discovery cache. The cache is only used if the serial number
+        matches and the SunSpec end block is still where the cached model lengths put it.
+        Returns True if the session devices were filled from the cache.
+        """
+        path = self.cachePath()
+        if path is None or not os.path.exists(path): return False
+        try:
+            with open(path) as f:
+                cache = json.load(f)
+        except (IOError, ValueError) as e:
+            self.logger.error('Failed to read discovery cache %s: %s', path, e)
+            return False
+        serial = self.readSerial()
+        entry = cache.get(serial) if serial else None
+        if not entry or not entry.get('devices'):
+            self.logger.info('No cached devices for AXS Port serial %s', serial)
+            return False
+        end = entry['devices'][-1]
+        register = self.session.read_holding_registers(end['addr'], 2)
+        if register is None: return False
+        table = self.session.table()
+        if table is not None:
+            register = [table[r] for r in register]
+        if register[0] != end['type']:
+            self.logger.info('Cached devices for %s are stale (model lengths changed), rescanning.', serial)
+            return False
+        for cached in entry['devices']:
+            port, mode = DEVICE_PORT_REGISTERS.get(cached['type'], (None, None))
+            if (port is not None and cached['port'] is None) or (mode is not None and cached['mode'] is None):
+                self.logger.info('Cached devices for %s are incomplete, rescanning.', serial)
+                return False
+        devices = []
+        for cached in entry['devices']:
+            dev = self.SunSpecDevice(self, cached['id'], SUNSPEC_DEVICE_LOOKUP.get(cached['type']), cached['type'], cached['addr'], cached['offset'])
+            dev.port = cached['port']
+            dev.mode = cached['mode']
+            devices.append(dev)
+        self.session.setDevices(devices)
+        self.logger.info('OutBack: %i devices were loaded from the discovery cache', len(self.session.devices))
+        return True
+
+    def saveDevices(self):
+        """
+        Saves the session devices to the discovery cache, keyed by the AXS Port serial number.
+        """
+        devices = self.session.devices
+        path = self.cachePath()
+        serial = self.readSerial()
+        if path is None or not serial or not devices: return
+        cache = {}
+        if os.path.exists(path):
+            try:
+                with open(path) as f:
+                    cache = json.load(f)
+            except (IOError, ValueError):
+                cache = {}
+        cache[serial] = {
+            'lengths': [dev.offset for dev in devices],
+            'devices': [{'id': dev.id, 'type': dev.type, 'addr': dev.addr, 'offset': dev.offset,
+                         'port': dev.port, 'mode': dev.mode} for dev in devices]
+        }
+        try:
+            with open(path + '.tmp', 'w') as f:
+                json.dump(cache, f, indent=1, sort_keys=True)
+            os.rename(path + '.tmp', path)
+        except (IOError, OSError) as e:
+            self.logger.error('Failed to write discovery cache %s: %s', path, e)
+
+    def rescan(self, **kwargs):
+        """
+        Ignore the discovery cache, walk all the SunSpec models again and add any new nodes. Every
+        node reads its config tier (and the scale factors of the new devices) on the next poll.
+        """
+        self.logger.info('Rescanning the AXS Port for devices.')
+        if not self.openConnection(): return False
+        if not self.getDevices(): return False
+        self.determineSetup()
+        self.saveDevices()
+        self.addInverters(self)
+        for node in self.nodes():
+            node.config_due = True
+        return True
 
     def determineSetup(self):
         """
         Takes all the devices found and determines what kind of implementation we have
-        and sets the global type constants.
-        """
-        global DEPLOYMENTCONFIG
-        global DEPLOYMENTPHASE
-        global DEPLOYMENTTYPE
-        if SUNSPEC_INVERTER_SINGLE_DID in DEPLOYMENTDEVICES: DEPLOYMENTPHASE = 'Single'
-        elif SUNSPEC_INVERTER_SPLIT_DID in DEPLOYMENTDEVICES: DEPLOYMENTPHASE = 'Split'
-        elif SUNSPEC_INVERTER_3PHASE_DID in DEPLOYMENTDEVICES: DEPLOYMENTPHASE = 'Three'
-        if SUNSPEC_OUTBACK_FX_DID in DEPLOYMENTDEVICES:
-            DEPLOYMENTCONFIG = SUNSPEC_OUTBACK_FX_CONFIG_DID
-            DEPLOYMENTTYPE = 'FX'
-        elif (SUNSPEC_OUTBACK_GS_SPLIT_DID in DEVICES) or (SUNSPEC_OUTBACK_GS_SINGLE_DID in DEVICES):
-            DEPLOYMENTCONFIG = SUNSPEC_OUTBACK_GS_CONFIG_DID
-            DEPLOYMENTTYPE = 'GS'
+        and sets the deployment type of the session.
+        """
+        found = self.session.deployment_devices
+        phase = type = config = fndc_config = None
+        if SUNSPEC_INVERTER_SINGLE_DID in found: phase = 'Single'
+        elif SUNSPEC_INVERTER_SPLIT_DID in found: phase = 'Split'
+        elif SUNSPEC_INVERTER_3PHASE_DID in found: phase = 'Three'
+        if SUNSPEC_OUTBACK_FX_DID in found:
+            config = SUNSPEC_OUTBACK_FX_CONFIG_DID
+            type = 'FX'
+        elif (SUNSPEC_OUTBACK_GS_SPLIT_DID in found) or (SUNSPEC_OUTBACK_GS_SINGLE_DID in found):
+            config = SUNSPEC_OUTBACK_GS_CONFIG_DID
+            type = 'GS'
         else:
             self.logger.error('Neither GS nor FX deployments found... thats fun.')
-        self.logger.info(str(DEPLOYMENTTYPE) + ' ' + str(DEPLOYMENTPHASE) + ' phase deployment found. Config register at : ' + str(DEPLOYMENTCONFIG))
-        if SUNSPEC_OUTBACK_FNDC_DID in DEPLOYMENTDEVICES:
-            global FNDC
-            global FNDCCONFIG
-            FNDC = True
-            FNDCCONFIG = SUNSPEC_OUTBACK_FNDC_CONFIG_DID
-            self.logger.info('FLEXnet-DC Device Found. Config register at : ' + str(FNDCCONFIG))
+        self.logger.info(str(type) + ' ' + str(phase) + ' phase deployment found. Config register at : ' + str(config))
+        if SUNSPEC_OUTBACK_FNDC_DID in found:
+            fndc_config = SUNSPEC_OUTBACK_FNDC_CONFIG_DID
+            self.logger.info('FLEXnet-DC Device Found. Config register at : ' + str(fndc_config))
+        self.session.setDeployment(phase, type, config, fndc_config)
+
+    def logMetrics(self, **kwargs):
+        """
+        Write the Modbus request metrics (latency histograms, failures, reconnects...) of this AXS Port
+        to the log. Returns the metrics.
+        """
+        return self.session.metrics.log(self.logger, '%s:%s' % (self.session.host, self.session.port))
 
     def verifySunSpec(self):
         '''
         Verify that the device returns the ID of a SunSpec device
         0x53756E53 at the first 2 bits of register 40000
         '''
-        try: 
-            register = C.read_holding_registers(SUNSPEC_MODBUS_REGISTER_OFFSET - 1, 2)
-            sunSpecId = '0x{0:08X}'.format(register[0] << 16 | register[1])
-            if sunSpecId == SUNSPECID: return True
-        except:
-            self.logger.info('Trying Encrypted')
-        # Try Encrypted
-        if self.getEncryptionKey():
-            register = C.read_holding_registers(40000, 3)        
-            register[1] = DECRYPT(ENCRYPTIONKEY,register[1])
-            sunSpecId = '0x{0:08X}'.format((register[0] << 16) | register[1])
-            # For testing
-            # self.logger.info('ID: %s', sunSpecId)
-            if sunSpecId == SUNSPECID: 
-                global ENCRYPTED
-                ENCRYPTED = True
-                return True
-            self.logger.info('Invalid register for SunSpec device type. 40000 should return 32-bit hex value of 0x53756E53')
-        return False
+        return self.session.verify()
 
     def openConnection(self):
         """
         The openConnection method to open/re-open or verify connection to AXS Port is open.
+        The session is kept open between calls, only the first connection is verified.
         """
-        global C
-        C = ModbusClient()
-        C.host(DEVICEIP)
-        C.port(DEVICEPORT)
-        C.timeout(10)
-        if not C.is_open():
-            if not C.open():
-                self.logger.info('Connection unsuccessful. Check IP or port settings')
-                return False
-        # Verify this is a SunSpec device at all
-        if (self.verifySunSpec()): return True
-        return False
-            
+        return self.session.open()
+
     def getEncryptionKey(self):
-        global ENCRYPTIONKEY
-        try:
-            ENCRYPTIONKEY = C.read_holding_registers(40076, 1)[0]
-            if DEBUGLEVEL == '2':
-                self.logger.debug('Encryption Key Found: %i', ENCRYPTIONKEY)
-            return True
-        except TypeError as e:
-            self.logger.error('Failed to get Encryption Key, connection failed')
-            return False
+        return self.session.getEncryptionKey()
 
     def closeConnection(self):
         """
         Closes the connection to the AXS Port
         """
-        C.close()
+        self.session.close()
         
     def setRegister(self, **kwargs):
         """
@@ -922,27 +1025,60 @@ class OutbackNode(Node):
         """
         self.logger.info('kwargs: %s', kwargs)
         register = kwargs.get('cmd')
-        regtype = getRegisterDevType(register)
+        regtype = getRegisterDevType(register, self.session.phase)
         value = kwargs.get('value')
         val = int()
         uom = kwargs.get('uom')
         self.logger.info('setRegister: %s(%i) UOM: %s = %s', register, regtype, uom, value)
         if (self.openConnection()):  
-            for dev in DEVICES:
+            for dev in self.session.devices:
                 if dev.type == regtype:
                     if uom == 25: val = int(value)
                     elif uom == 30: val = int(value * 10)
                     elif uom in [1, 72]: val = float(value * 10)
                     else: val = value
-                    self.logger.info('Attempting setOne')
-                    if setOne(self.logger, dev, register, val):
-                        try:
-                            self.set_driver('GV' + str((self.registers_needed.index(register) + 1)), value)
-                        except ValueError as e:
-                            self.logger.info('No ST field for the register: %s', register)                      
-        self.closeConnection()
+                    self.logger.info('Queueing write')
+                    self.writes.put(dev, register, val, writeDone(self, register, value))
         return True
 
+    def applySettings(self, settings, port=None):
+        """
+        Apply several configuration changes at once, e.g. a new charging profile. Values are in the
+        units the registers decode to (volts, amps, ...). The changes for each device are written
+        with setMany, so contiguous fields go out in a single write. Every setting is checked before
+        anything is written, a profile with an unknown, read-only or non-numeric setting is rejected
+        as a whole.
+
+        :param settings: Dictionary of register name to value, e.g. {'FXconfig_Sell_Volts': 52.0}
+        :param port: Only change the devices on this port (None for all devices of the model, like setRegister)
+        """
+        models = {}
+        for regname, value in settings.items():
+            if regname not in REGISTER_INDEX:
+                self.logger.error('applySettings: Unknown register %s', regname)
+                return False
+            did, field = REGISTER_INDEX[regname]
+            devtype = getRegisterDevType(regname, self.session.phase)
+            if not field[5] or field[1] > 2 or did != devtype:
+                self.logger.error('applySettings: %s is not a writable register', regname)
+                return False
+            try:
+                models.setdefault(devtype, {})[regname] = encodeValue(field, value)
+            except (TypeError, ValueError):
+                self.logger.error('applySettings: Invalid value %r for %s', value, regname)
+                return False
+        if not self.openConnection(): return False
+        success = True
+        for devtype, values in models.items():
+            for dev in self.session.devices:
+                if dev.type != devtype: continue
+                if port is not None and dev.port != port: continue
+                if not setMany(self.logger, dev, values):
+                    success = False
+        for node in self.nodes():
+            node.config_due = True
+        return success
+
     _drivers = {
                 'GV1': [0, 30, float], 'GV2': [0, 4, int],
                 'GV3': [0, 72, float], 'GV4': [0, 1, float],
@@ -951,6 +1087,8 @@ class OutbackNode(Node):
                 }
 
     _commands = {'QUERY': query,
+                            'RESCAN': rescan,
+                            'METRICS': logMetrics,
                             'OutBack_Load_Grid_Transfer_Threshold': setRegister,
                             'OB_Inverter_AC_Drop_Use': setRegister,
                             'OB_Set_Inverter_Mode': setRegister,
@@ -995,7 +1133,6 @@ def convertString(register):
         return
     value = ''
     for bit in register:
-        if ENCRYPTED == True: bit = DECRYPT(ENCRYPTIONKEY,bit)
         a,b = struct.unpack('2B', struct.pack('>H', bit))
         value += chr(a) + chr(b)
     return value
@@ -1004,7 +1141,6 @@ def convertFloat(register):
     """
     Convert bits to single decimal float. I.E '23.2'
     """
-    if ENCRYPTED == True: register[0] = DECRYPT(ENCRYPTIONKEY,register[0])
     value = float(register[0]) / 10
     return '{0:.1f}'.format(value)
 
@@ -1012,7 +1148,6 @@ def convertFloat2(register):
     """
     Convert bits to two decimal float. I.E '23.23'
     """
-    if ENCRYPTED == True: register[0] = DECRYPT(ENCRYPTIONKEY,register[0])
     value = float(register[0]) / 10
     return '{0:.2f}'.format(value)
     
@@ -1021,7 +1156,6 @@ def shortHex(register):
     Convert bits to '0x0000' 16-bit notation
     """
     if register is not None:
-        if ENCRYPTED == True: register = DECRYPT(ENCRYPTIONKEY,register)
         return '0x{0:04X}'.format(register)
 
 def shortno0Hex(register):
@@ -1029,7 +1163,6 @@ def shortno0Hex(register):
     Convert bits to '0000' 16-bit notation no prefixed '0x'
     """
     if register is not None:
-        if ENCRYPTED == True: register[0] = DECRYPT(ENCRYPTIONKEY,register[0])
         return '{0:04X}'.format(register[0])
 
 def longHex(register):
@@ -1037,99 +1170,49 @@ def longHex(register):
     Convert bits to '0x00000000' 32-bit notation
     """
     if register is not None:
-        if ENCRYPTED == True: 
-            register[0] = DECRYPT(ENCRYPTIONKEY,register[0])
-            register[1] = DECRYPT(ENCRYPTIONKEY,register[1])
         return '0x{0:08X}'.format(register[0] | register[1] << 16)
 
-def checkRegister(register, register_type, register_valType, register_name):
+def checkRegister(register, register_type, register_valType, register_name, table=None):
     """
-    Checks the Register and Converts it to the proper format for output.
+    Checks the Register and Converts it to its native value (int, float or str) with the
+    compiled decoder of its model. Fields the device doesn't implement return NOT_IMPLEMENTED.
     
     :param register: The Register returned from the device in bits
     :param register_type: The type returned from the defs tables.
     :param register_valType: The value type returned from the defs tables.
     :param register_name: The name of the register returned from the defs tables.
+    :param table: The session's decrypt table, None if the AXS Port isn't encrypted
     """
-    value = ''
-    if  register_type == 'string':
-        value = convertString(register)
-    elif register_type == 'int32':
-        value = convert32bit(register)
-        if value == '0xFFFFFFFF' or value == '0x00000000':
-            value = 'Not Implemented'
-    elif register_type == 'float':
-        value = convertFloat(register)
-    elif register_type == 'float2':
-        value = convertFloat2(register)
-    elif register_type == 'ipaddress':
-        value = convertIP(register)
-    elif register_type == 'hex4':
-        value = shortHex(register)
-        if value == '0xFFFF':
-            value = 'Not Implemented'
-    elif register_type == 'uhex4':
-        value = shortHex(register)
-        if value == '0xFFFF':
-            value = '-1'
-        elif value == '0xFFFE':
-            value = '-2'
-        elif value == '0xFFFD':
-            value = '-3'
-        elif value == '0xFFFC':
-            value = '-4'
-        elif value == '0xFFFB':
-            value = '-5'
-        elif value == '0xFFFA':
-            value = '-6'
-        elif value == '0xFFF9':
-            value = '-7'
-        elif value == '0xFFF8':
-            value = '-8'
-        elif value == '0x0000':
-            value = '0'
-    elif register_type == 'hex8':
-        value = longHex(register)
-        if value == '0xFFFFFFFF' or value == '0x00000000':
-            value = 'Not Implemented'
-    else:
-        if register[0] == 65535 or register[0] == 32768:
-            value = 'Not Implemented'
-        else:
-            if ENCRYPTED == True: register[0] = DECRYPT(ENCRYPTIONKEY,register[0])
-            if register_valType == 'ENUMERATED_U':
-                if register_name == 'I_Status':
-                    value = STATUS_MAP[register[0]]
-            if value == '':
-                value = register[0]
-    return value
+    return decodeRegister(register_name, register, table)
 
-def getRegisterDevType(register):
+def gatewayPrefix(index):
+    """
+    Address prefix of the nodes of an AXS Port: '' for the first one in GATEWAYS, then one base 36
+    digit ('1' to '9', 'a' to 'z') so the addresses stay within NODE_ADDRESS_LENGTH.
+
+    :param index: Position of the AXS Port in GATEWAYS
+    """
+    digits = '0123456789abcdefghijklmnopqrstuvwxyz'
+    prefix = ''
+    while index:
+        index, digit = divmod(index, len(digits))
+        prefix = digits[digit] + prefix
+    return prefix
+
+def getRegisterDevType(register, phase=None):
     """
     Gets the device type of the register
     
     :param register: The register we are trying to find the type of
+    :param phase: The deployment phase of the AXS Port ('Single', 'Split' or 'Three') for inverter registers
     """
-    type = None
-    regprefix = register.split('_')[0]
-    if regprefix == 'OutBack': type = 64110
-    elif regprefix == 'CC': type = 64111
-    elif regprefix == 'CCconfig': type = 64112
-    elif regprefix == 'GS': 
-        if register.split('_')[1] == 'Split': type = 64115
-        else: type = 64117
-    elif regprefix == 'GSconfig': type = 64116
-    elif regprefix == 'FX': type = 64113
-    elif regprefix == 'FXconfig': type = 64114
-    elif regprefix == 'FN': type = 64118
-    elif regprefix == 'FNconfig': type = 64119
-    elif regprefix == 'OB': type = 64120
-    elif regprefix == 'C': type = 1
-    elif regprefix == 'I': 
-        if DEPLOYMENTPHASE == 'Single': type = 101
-        elif DEPLOYMENTPHASE == 'Split': type = 102
-        else: type = 103
-    return type
+    entry = REGISTER_INDEX.get(register)
+    if entry is None: return None
+    if entry[0] == SUNSPEC_INVERTER_SINGLE_DID:
+        if phase == 'Single': return 101
+        elif phase == 'Split': return 102
+        else: return 103
+    return entry[0]
     
 def setOne(logger, device, regname, value):
     """
@@ -1141,19 +1224,71 @@ def setOne(logger, device, regname, value):
     :param value: The value we are writing to the register
     """
     try:
-         for i in range(len(SUNSPEC_DEVICE_MAP[device.type])):
-            if SUNSPEC_DEVICE_MAP[device.type][i][7] == regname:
-                address = device.addr + SUNSPEC_DEVICE_MAP[device.type][i][0] - 1
-                if C.write_single_register(address, value):
-                    logger.info('Wrote to register: ' + str(address) + ' Value: ' + str(value))
-                else:
-                    logger.error('Failed to write to register: ' + str(address) + ' Value: ' + str(value))
-                    return False
-                #logger.info(register_name + '(' + str(address) + '): ' + str(register_type) + ' : ' + str(value))
-                return True
+        entry = REGISTER_INDEX.get(regname)
+        if entry is None or entry[0] != device.type: return None
+        address = device.addr + entry[1][0] - 1
+        session = device.session
+        table = session.encryptTable()
+        raw = table[int(value) & 0xFFFF] if table is not None else value
+        if session.write_single_register(address, raw):
+            logger.info('Wrote to register: ' + str(address) + ' Value: ' + str(value))
+        else:
+            logger.error('Failed to write to register: ' + str(address) + ' Value: ' + str(value))
+            return False
+        return True
     except TypeError as e:
         logger.error('setOne ERROR: %s', e)
 
+def planWrites(writes, limit=MAX_WRITE_REGISTERS):
+    """
+    planWrites Method groups register writes into runs of adjacent registers, so each run can be
+    written with one write_multiple_registers call. Returns a list of [address, [words]]
+
+    :param writes: List of (address, [words]) tuples
+    :param limit: The maximum number of registers in a single write (123 for Modbus)
+    """
+    runs = []
+    for address, words in sorted(writes, key=lambda w: w[0]):
+        if runs and runs[-1][0] + len(runs[-1][1]) == address and len(runs[-1][1]) + len(words) <= limit:
+            runs[-1][1].extend(words)
+        else:
+            runs.append([address, list(words)])
+    return runs
+
+def setMany(logger, device, values):
+    """
+    setMany Method sets several registers of one device in the OutBack via the AXS Port Modbus interface,
+    writing adjacent fields together with write_multiple_registers. Returns True if every write succeeded.
+
+    :param logger: Passes the logger into the function as we don't use a global logger
+    :param device: The device we are writing to
+    :param values: Dictionary of register name to raw value (as for setOne)
+    """
+    writes = []
+    for regname, value in values.items():
+        entry = REGISTER_INDEX.get(regname)
+        if entry is None or entry[0] != device.type or not entry[1][5] or entry[1][1] > 2:
+            logger.error('setMany ERROR: %s is not a writable register of model %s', regname, device.type)
+            return False
+        value = int(value)
+        words = [value & 0xFFFF, (value >> 16) & 0xFFFF][:entry[1][1]]
+        writes.append((device.addr + entry[1][0] - 1, words))
+    session = device.session
+    table = session.encryptTable()
+    success = True
+    for address, words in planWrites(writes):
+        raw = [table[w] for w in words] if table is not None else words
+        if len(raw) == 1:
+            written = session.write_single_register(address, raw[0])
+        else:
+            written = session.write_multiple_registers(address, raw)
+        if written:
+            logger.info('Wrote %i registers at %i: %s', len(words), address, words)
+        else:
+            logger.error('Failed to write %i registers at %i: %s', len(words), address, words)
+            success = False
+    return success
+
 def getOne(logger, device, regname):
     """
     getOne Method gets the value of a single register in the OutBack via the AXS Port Modbus interface
@@ -1164,44 +1299,236 @@ def getOne(logger, device, regname):
     :param regname: The register name we are reading
     """
     try:
-         for i in range(len(SUNSPEC_DEVICE_MAP[device.type])):
-            if SUNSPEC_DEVICE_MAP[device.type][i][7] == regname:
-                address = device.addr + SUNSPEC_DEVICE_MAP[device.type][i][0] - 1
-                register = C.read_holding_registers(address, SUNSPEC_DEVICE_MAP[device.type][i][1])
-                register_type = SUNSPEC_DEVICE_MAP[device.type][i][2]
-                register_valType = SUNSPEC_DEVICE_MAP[device.type][i][3]
-                register_name = SUNSPEC_DEVICE_MAP[device.type][i][7]
-                value = checkRegister(register, register_type, register_valType, register_name)
-                # TODO: comment out before release
-                # logger.info(register_name + '(' + str(address) + '): ' + str(register_type) + ' : ' + str(value))
-                return value
+        entry = REGISTER_INDEX.get(regname)
+        if entry is None or entry[0] != device.type: return None
+        field = entry[1]
+        address = device.addr + field[0] - 1
+        register = device.session.read_holding_registers(address, field[1])
+        return checkRegister(register, field[2], field[3], field[7], device.session.table())
     except TypeError as e:
         logger.error('getOne ERROR: %s', e)
 
-def getAll(logger, devtype, port):
+def planReads(fields, limit=MAX_READ_REGISTERS):
+    """
+    planReads Method groups register fields into the fewest contiguous holding register reads.
+    Any gap between two fields is read along with them as long as the whole range stays within
+    the Modbus limit. Returns a list of [address, count, [(address, field), ...]]
+
+    :param fields: List of (address, field) tuples, field being the entry from SUNSPEC_DEVICE_MAP
+    :param limit: The maximum number of registers in a single read (125 for Modbus)
+    """
+    reads = []
+    for address, field in sorted(fields, key=lambda f: f[0]):
+        end = address + field[1]
+        if reads and (end - reads[-1][0]) <= limit:
+            reads[-1][1] = max(reads[-1][1], end - reads[-1][0])
+            reads[-1][2].append((address, field))
+        else:
+            reads.append([address, field[1], [(address, field)]])
+    return reads
+
+def outsideDeadband(last, value, deadband):
+    """
+    True if value moved past the deadband since the last value sent.
+
+    :param last: The last value sent
+    :param value: The new value
+    :param deadband: (absolute, relative) tuple from DEADBANDS or None for any change
+    """
+    if value == last: return False
+    if deadband is None: return True
+    try:
+        delta = abs(float(value) - float(last))
+        return delta > max(deadband[0], deadband[1] * abs(float(last)))
+    except (TypeError, ValueError):
+        return True
+
+def writeDone(node, register, value):
+    """
+    Builds the WriteQueue callback for a write from the ISY: once the write went through, the
+    node's config tier is re-read on the next poll and the driver shows the new value.
+
+    :param node: The node the command came from
+    :param register: The register name
+    :param value: The value from the ISY
+    """
+    def done(success):
+        if not success: return
+        node.config_due = True
+        try:
+            setDriver(node, 'GV' + str((node.registers_needed.index(register) + 1)), value, force=True)
+        except ValueError as e:
+            node.logger.info('No ST field for the register: %s', register)
+    return done
+
+def setDriver(node, driver, value, force=False):
+    """
+    Send a driver value to the ISY unless it is within the deadband (see deadbandOf()) of the last
+    value sent. Counts sent and suppressed updates on the node. Polled values are also added to the
+    node server's telemetry history (in memory and on disk), whether they are sent or not.
+
+    :param node: The node that owns the driver
+    :param driver: The driver, e.g. 'GV1'
+    :param value: The new value
+    :param force: Send even if the value is within the deadband (e.g. after a write)
+    """
+    if not force:
+        history = getattr(node.parent, 'history', None)
+        if history is not None:
+            history.record(node.address, driver, value)
+        store = getattr(node.parent, 'store', None)
+        if store is not None:
+            store.append(node.address, driver, value)
+    if not force and driver in node.sent and not outsideDeadband(node.sent[driver], value, deadbandOf(node, driver)):
+        node.updates_suppressed += 1
+        return False
+    node.sent[driver] = value
+    node.updates_sent += 1
+    return node.set_driver(driver, value)
+
+def driverRegister(node, driver):
+    """
+    Gets the register name a node reports on a driver ('GV<n>' is the n-th of registers_needed),
+    None if the driver isn't one of them.
+
+    :param node: The node that owns the driver
+    :param driver: The driver, e.g. 'GV1'
+    """
+    registers = getattr(node, 'registers_needed', None)
+    if not registers or not driver.startswith('GV') or not driver[2:].isdigit(): return None
+    index = int(driver[2:]) - 1
+    return registers[index] if 0 <= index < len(registers) else None
+
+def deadbandOf(node, driver):
+    """
+    Gets the deadband of a driver. Only fast tier telemetry has one (from DEADBANDS by the driver UOM),
+    config tier and enumerated registers return None so they are sent on any change.
+
+    :param node: The node that owns the driver
+    :param driver: The driver, e.g. 'GV1'
+    """
+    regname = driverRegister(node, driver)
+    if regname is not None:
+        if pollTier(regname) != TIER_FAST: return None
+        entry = REGISTER_INDEX.get(regname)
+        if entry is not None and entry[1][3].startswith('ENUMERATED'): return None
+    uom = node._drivers[driver][1] if driver in node._drivers else None
+    return DEADBANDS.get(uom)
+
+def pollTier(regname):
+    """
+    Gets the poll tier of a register, TIER_CONFIG for writable registers and TIER_FAST for
+    everything else unless overridden in POLL_TIERS.
+
+    :param regname: The register name
+    """
+    if regname in POLL_TIERS: return POLL_TIERS[regname]
+    entry = REGISTER_INDEX.get(regname)
+    if entry is not None and entry[1][5]: return TIER_CONFIG
+    return TIER_FAST
+
+def registersDue(node):
+    """
+    Gets the registers of a node that are due on this poll. Fast tier registers are due every poll,
+    config tier registers every CONFIG_POLL_CYCLES polls and on the poll after a write. The scale
+    factors of SunSpec inverter registers are read along with the config tier.
+
+    :param node: The node being polled (uses registers_needed, polls and config_due)
+    """
+    if node.config_due or node.polls % CONFIG_POLL_CYCLES == 0:
+        node.config_due = False
+        regnames = node.registers_needed + scaleFactorsOf(node.registers_needed)
+    else:
+        regnames = [r for r in node.registers_needed if pollTier(r) == TIER_FAST]
+    node.polls += 1
+    return regnames
+
+def scaleFactorsOf(regnames):
+    """
+    Gets the scale factor registers of the SunSpec inverter registers in regnames
+
+    :param regnames: List of register names
+    """
+    factors = []
+    for regname in regnames:
+        entry = REGISTER_INDEX.get(regname)
+        if entry is not None and entry[1][4] in SCALE_FACTORS and entry[1][4] not in factors:
+            factors.append(entry[1][4])
+    return factors
+
+def getMany(logger, session, regnames, port=None):
+    """
+    getMany Method gets the values of several registers in the OutBack via the AXS Port Modbus interface
+    using as few reads as possible. Returns a dictionary of register name to value, registers that
+    could not be found or read are left out. Scale factors read are cached on their device and
+    SunSpec inverter values are scaled with the device's cached scale factors.
+
+    :param logger: Passes the logger into the function as we don't use a global logger
+    :param session: The ModbusSession of the AXS Port to read from
+    :param regnames: List of register names we are reading
+    :param port: Only read from devices on this port (None for any port)
+    """
+    fields = []
+    owners = {}
+    for regname in regnames:
+        if regname not in REGISTER_INDEX: continue
+        devtype = getRegisterDevType(regname, session.phase)
+        field = REGISTER_INDEX[regname][1]
+        for device in session.devices:
+            if device.type != devtype: continue
+            if port is not None and device.port != port: continue
+            fields.append((device.addr + field[0] - 1, field))
+            owners[device.addr + field[0] - 1] = device
+    values = {}
+    table = session.table()
+    reads = planReads(fields)
+    registers = session.read_many([(address, count) for address, count, block in reads])
+    decoded = []
+    for (address, count, block), register in zip(reads, registers):
+        if register is None:
+            logger.error('getMany ERROR: Failed to read %i registers at %i', count, address)
+            continue
+        for field_address, field in block:
+            start = field_address - address
+            decoded.append((field_address, field, register[start:start + field[1]]))
+    # Scale factors first, so values read along with them are scaled with the fresh ones
+    decoded.sort(key=lambda d: d[1][7] not in SCALE_FACTORS)
+    for field_address, field, register in decoded:
+        factors = getattr(owners[field_address], 'scale_factors', None)
+        value = decodeRegister(field[7], register, table, factors)
+        if factors is not None and field[7] in SCALE_FACTORS:
+            factors[field[7]] = None if value is NOT_IMPLEMENTED else value
+        values[field[7]] = value
+    return values
+
+def getAll(logger, session, devtype, port):
     """
     getAll Method gets the values of a all the registers in the OutBack via the AXS Port Modbus interface
     and logs all the values to the logger. This is currently not used for any functional part of the program
     this will be used as a test scenario at some point.
     
     :param logger: Passes the logger into the function as we don't use a global logger
+    :param session: The ModbusSession of the AXS Port to read from
     :param devtype: The device type that we are wanting to read all the registers for
     :param port: The port we want to read from we can have multiples of the same devices,
                             they will be on different ports in the configuration
     """
-    for device in DEVICES:
+    for device in session.devices:
         if device.type == devtype:
             if device.port == port:
-                i = 0
-                for i in range(len(SUNSPEC_DEVICE_MAP[device.type])):
-                    address = device.addr + SUNSPEC_DEVICE_MAP[device.type][i][0] - 1
-                    register = C.read_holding_registers(address, SUNSPEC_DEVICE_MAP[device.type][i][1])
-                    register_type = SUNSPEC_DEVICE_MAP[device.type][i][2]
-                    register_valType = SUNSPEC_DEVICE_MAP[device.type][i][3]
-                    register_name = SUNSPEC_DEVICE_MAP[device.type][i][7]
-                    value = checkRegister(register, register_type, register_valType, register_name)
-                    
-                    logger.info(register_name + '(' + str(address) + '): ' + str(register_type) + ' : ' + str(value))
+                decoder = getDecoder(device.type)
+                reads = [(address, min(MAX_READ_REGISTERS, device.addr + decoder.length - address))
+                         for address in range(device.addr, device.addr + decoder.length, MAX_READ_REGISTERS)]
+                block = []
+                for register in session.read_many(reads):
+                    if register is None:
+                        logger.error('getAll ERROR: Failed to read model %i', device.type)
+                        return
+                    block.extend(register)
+                values = decoder.decodeBlock(block, session.table())
+                for field in SUNSPEC_DEVICE_MAP[device.type]:
+                    address = device.addr + field[0] - 1
+                    logger.info(field[7] + '(' + str(address) + '): ' + str(field[2]) + ' : ' + str(values.get(field[7])))
 
 def myfloat(value, prec=2):
     """
@@ -0,0 +1,98 @@
+"""
+Coalescing of register writes sent from the ISY.
+"""
+
+import threading
+from outback_defs import *
+
+
+class WriteQueue(object):
+    """
+    Holds register writes for `window` seconds before sending them. A newer write to
+    a register that is still pending replaces the older one, so when a slider or an ISY
+    program sends a burst of setpoints only the last value reaches the AXS Port. Pending
+    writes are sent together per device, so adjacent fields share one Modbus write.
+
+    :param logger: The logger to report writes to
+    :param write: Function (logger, device, {register name: raw value}) returning True on success
+    :param window: Seconds to hold writes, 0 to write immediately
+    """
+    def __init__(self, logger, write, window=WRITE_COALESCE_WINDOW):
+        self.logger = logger
+        self.write = write
+        self.window = window
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.timer = None
+        self.queued = 0
+        self.written = 0
+        self.collapsed = 0
+        self.failed = 0
+        self.flushes = 0
+
+    def put(self, device, regname, value, callback=None):
+        """
+        Queue a write. The callback, if any, is called with True/False once the write went out
+        and is dropped if a newer write to the same register replaces this one.
+
+        :param device: The device to write to
+        :param regname: The register name
+        :param value: The raw value (as for setOne)
+        :param callback: Function called with the result of the write
+        """
+        with self.lock:
+            key = (device.addr, regname)
+            if key in self.pending:
+                self.collapsed += 1
+            self.pending[key] = (device, regname, value, callback)
+            self.queued += 1
+            if self.window <= 0 or self.timer is not None:
+                start = False
+            else:
+                self.timer = threading.Timer(self.window, self.flush)
+                self.timer.daemon = True
+                start = True
+        if start:
+            self.timer.start()
+        elif self.window <= 0:
+            self.flush()
+
+    def flush(self):
+        """
+        Send all the pending writes now.
+        """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        if not pending: return
+        devices = {}
+        for device, regname, value, callback in pending.values():
+            devices.setdefault(device.addr, (device, {}, []))
+            devices[device.addr][1][regname] = value
+            if callback is not None:
+                devices[device.addr][2].append(callback)
+        for device, values, callbacks in devices.values():
+            success = self.write(self.logger, device, values)
+            with self.lock:
+                if success:
+                    self.written += len(values)
+                else:
+                    self.failed += len(values)
+            for callback in callbacks:
+                try:
+                    callback(success)
+                except Exception:
+                    self.logger.exception('Write callback failed')
+        with self.lock:
+            self.flushes += 1
+        self.logger.info('Flushed %i register writes (%i collapsed so far)', len(pending), self.collapsed)
+
+    def stats(self):
+        """
+        Write counters: queued, written, collapsed (replaced before they were sent), failed and flushes.
+        """
+        with self.lock:
+            return {'queued': self.queued, 'written': self.written, 'collapsed': self.collapsed,
+                    'failed': self.failed, 'flushes': self.flushes, 'pending': len(self.pending)}